@@ -6,16 +6,18 @@
 
 import argparse
 import logging
+import sqlite3
+from contextlib import closing
 from datetime import datetime, timezone
 from logging.config import dictConfig
 from pathlib import Path
-from shutil import copy2
 
 from flask import Flask, Response
 from flask_babel import Babel
 from flask_login import LoginManager
 from flask_migrate import Migrate, check, downgrade, migrate, upgrade
 from flask_wtf import CSRFProtect
+from sqlalchemy import event
 from sqlalchemy.exc import OperationalError
 from werkzeug.middleware.proxy_fix import ProxyFix
 from werkzeug.security import generate_password_hash
@@ -27,7 +29,7 @@ from .imap_worker import (
     cleanup_sent_emails,
     initialize_imap_polling,
 )
-from .models import AlembicVersion, User, db
+from .models import AlembicVersion, User, db, set_sqlite_pragmas
 from .seeder import seed_database
 from .utils import (
     compile_scss_on_startup,
@@ -90,12 +92,15 @@ def backup_sqlite_database(config_database_uri: str) -> None:
     date = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
     backup_path = f"{db_path}.backup-{date}"
 
-    # Copy database file to backup location
-    try:
-        copy2(db_path, backup_path)
-        logging.info("Database backed up to %s", backup_path)
-    except FileNotFoundError:
+    if not db_path.is_file():
         logging.warning("Database file not found, skipping backup")
+        return
+
+    # Use SQLite's online backup instead of copying the file, so that changes which are still only
+    # in the write-ahead log are included
+    with closing(sqlite3.connect(db_path)) as src, closing(sqlite3.connect(backup_path)) as dst:
+        src.backup(dst)
+    logging.info("Database backed up to %s", backup_path)
 
 
 def create_app(  # noqa: PLR0915
@@ -161,6 +166,8 @@ def create_app(  # noqa: PLR0915
     migrations_dir = str(Path(__file__).parent.resolve() / "migrations")
     db.init_app(app)
     Migrate(app=app, db=db, directory=migrations_dir)
+    with app.app_context():
+        event.listen(db.engine, "connect", set_sqlite_pragmas)
 
     # Trust headers from reverse proxy (1 layer by default)
     app.wsgi_app = ProxyFix(  # type: ignore[ty:invalid-assignment]
@@ -204,11 +211,14 @@ def create_app(  # noqa: PLR0915
     app.register_blueprint(messages)
     app.register_blueprint(subscribers)
 
-    # Inject variables and functions into templates
+    # Inject variables and functions into templates. The version info does not change while the app
+    # is running, so determine it once instead of calling git on every request in debug mode
+    version_info = get_version_info(debug=app.debug)
+
     @app.context_processor
     def inject_vars() -> dict:
         return {
-            "version_info": get_version_info(debug=app.debug),
+            "version_info": version_info,
         }
 
     # Add HTTP security headers to every response
@@ -287,8 +297,7 @@ def run_one_off_commands(app: Flask, args: argparse.Namespace) -> None:  # noqa:
         username, password = args.create_admin
         # run inside app context to access DB
         with app.app_context():
-            existing = User.query.filter_by(username=username).first()
-            if existing:
+            if db.session.query(User.query.filter_by(username=username).exists()).scalar():
                 logging.error("Error: user '%s' already exists", username)
                 return
             new_user = User(
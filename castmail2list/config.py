@@ -63,6 +63,7 @@ class AppConfig:  # pylint: disable=too-few-public-methods
     SMTP_USER: str = ""
     SMTP_PASS: str = ""
     SMTP_STARTTLS: bool = True
+    SMTP_MAX_CONNECTIONS: int = 4
 
     # Sender notification settings
     NOTIFY_REJECTED_SENDERS: bool = False
@@ -22,11 +22,11 @@ from .models import EmailIn, MailingList, Subscriber, db
 from .utils import (
     create_log_entry,
     get_all_messages_id_from_raw_email,
+    get_list_addresses,
     get_list_recipients_recursive,
     get_message_id_from_incoming,
     get_message_id_in_db,
     get_plus_suffix,
-    is_email_a_list,
     is_expanded_address_the_mailing_list,
     parse_bounce_address,
     parse_older_than,
@@ -35,13 +35,13 @@ from .utils import (
     run_only_once,
 )
 
-REQUIRED_FOLDERS_ENVS = [
+REQUIRED_FOLDERS_ENVS = (
     "IMAP_FOLDER_INBOX",
     "IMAP_FOLDER_PROCESSED",
     "IMAP_FOLDER_BOUNCES",
     "IMAP_FOLDER_DENIED",
     "IMAP_FOLDER_DUPLICATE",
-]
+)
 
 
 def _rss_mb() -> float:
@@ -92,7 +92,7 @@ def initialize_imap_polling(app: Flask) -> None:
 
 def create_required_folders(app: Flask, mailbox: MailBox) -> None:
     """Create required IMAP folders if they don't exist."""
-    for folder in [app.config[env] for env in REQUIRED_FOLDERS_ENVS]:
+    for folder in (app.config[env] for env in REQUIRED_FOLDERS_ENVS):
         if not mailbox.folder.exists(folder):
             mailbox.folder.create(folder=folder)
             logging.info("Created IMAP folder: %s", folder)
@@ -192,18 +192,22 @@ class IncomingEmail:
 
         Edits self.msg.to and self.msg.to_values in place.
         """
+        # Load the list addresses once for all To addresses, instead of querying per address
+        list_addresses = get_list_addresses()
+
         # Replace in msg.to
         to_addresses = list(self.msg.to)
         to_addresses = [
-            remove_plus_suffix(to) if is_email_a_list(to) else to for to in to_addresses
+            no_suffix if (no_suffix := remove_plus_suffix(to)).lower() in list_addresses else to
+            for to in to_addresses
         ]
         self.msg.to = tuple(to_addresses)
 
         # Replace in msg.to_values
         to_value_addresses = list(self.msg.to_values)
         for to_value in to_value_addresses:
-            if is_email_a_list(to_value.email):
-                to_value.email = remove_plus_suffix(to_value.email)
+            if (no_suffix := remove_plus_suffix(to_value.email)).lower() in list_addresses:
+                to_value.email = no_suffix
         self.msg.to_values = tuple(to_value_addresses)
 
     def _check_broadcast_sender_authorization(self) -> bool:
@@ -273,8 +277,9 @@ class IncomingEmail:
             # No restrictions
             return True
 
-        # Get list of subscriber emails
-        subscriber_emails: list[str] = list(get_list_recipients_recursive(self.ml.id).keys())
+        # Get subscriber emails. Kept as the mapping of email addresses, so that checking the sender
+        # is a hash lookup instead of a scan over all subscribers
+        subscriber_emails: dict[str, dict] = get_list_recipients_recursive(self.ml.id)
         # No subscribers configured, allow all
         if not subscriber_emails:
             return True
@@ -477,7 +482,9 @@ class IncomingEmail:
         """
         # Check if message already exists in database for this list to avoid identity conflicts
         message_id = get_message_id_from_incoming(self.msg)
-        existing = EmailIn.query.filter_by(message_id=message_id, list_id=self.ml.id).first()
+        existing: bool = db.session.query(
+            EmailIn.query.filter_by(message_id=message_id, list_id=self.ml.id).exists()
+        ).scalar()
 
         if existing:
             # Message is a duplicate for this list. Log, set a random Message-ID to avoid
@@ -591,6 +598,8 @@ def check_all_lists_for_messages(app: Flask) -> None:
 
                 # --- INBOX processing ---
                 mailbox.folder.set(app.config["IMAP_FOLDER_INBOX"])
+                # Recipients of the list, resolved once for all messages fetched in this run
+                recipients: list[str] | None = None
                 # Fetch unseen messages
                 for msg in mailbox.fetch(mark_seen=False):
                     incoming_msg = IncomingEmail(app, mailbox, msg, ml)
@@ -603,7 +612,11 @@ def check_all_lists_for_messages(app: Flask) -> None:
                         continue
                     # Process incoming message. If OK, send to subscribers
                     if incoming_msg.process_incoming_msg():
-                        send_msg_to_subscribers(app=app, msg=msg, ml=ml, mailbox=mailbox)
+                        if recipients is None:
+                            recipients = list(get_list_recipients_recursive(ml.id))
+                        send_msg_to_subscribers(
+                            app=app, msg=msg, ml=ml, mailbox=mailbox, recipients=recipients
+                        )
                     else:
                         logging.debug(
                             "Message %s not sent to subscribers due to errors or duplication "
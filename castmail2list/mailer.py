@@ -4,17 +4,23 @@
 
 """Mailer utility for sending emails via SMTP."""
 
+import atexit
 import logging
 import smtplib
-import tempfile
+import ssl
+import threading
+import time
 from collections import deque
-from copy import deepcopy
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from email import encoders
-from email.mime.base import MIMEBase
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.utils import formatdate, make_msgid
+from email import policy
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid, parsedate_to_datetime
+from functools import lru_cache
+from queue import LifoQueue
+from typing import NamedTuple
 
 from flask import Flask, render_template
 from flask_babel import _
@@ -23,14 +29,126 @@ from imap_tools.message import MailMessage
 
 from .models import EmailOut, MailingList, Subscriber, db
 from .utils import (
-    create_bounce_address,
+    create_bounce_address_template,
     create_log_entry,
+    format_bounce_address,
     generate_via_from_header,
     get_list_recipients_recursive,
     get_message_id_from_incoming,
     reply_to_from_email_and_name,
 )
 
+# CRLF line endings and strict header folding as required on the wire. Bodies are kept 7bit-clean
+# (quoted-printable/base64) as we cannot rely on every SMTP relay announcing 8BITMIME.
+SMTP_POLICY = policy.SMTP.clone(cte_type="7bit")
+
+# Submission port with implicit TLS (RFC 8314), which needs no STARTTLS round-trip
+SMTPS_PORT = 465
+
+# How long and how many connections of single emails are kept open for reuse
+SMTP_IDLE_TIMEOUT = 60
+SMTP_IDLE_MAX_SESSIONS = 8
+
+
+def _fold_header(name: str, value: str) -> bytes:
+    """Fold and encode a header line as it would be serialized as part of an EmailMessage."""
+    return SMTP_POLICY.fold(*SMTP_POLICY.header_store_parse(name, value)).encode("ascii")
+
+
+def _address_header(name: str, address: str) -> bytes:
+    """
+    Format a header line with a single address, as it would be serialized as part of an
+    EmailMessage. A plain ASCII address that fits into one line needs no parsing, encoding or
+    folding, which saves most of the per-recipient header work.
+    """
+    if (
+        address.isascii()
+        and len(name) + len(address) + 2 <= SMTP_POLICY.max_line_length
+        and not any(char in address for char in ' \t\r\n,;:"<>()[]\\')
+    ):
+        return f"{name}: {address}\r\n".encode("ascii")
+    return _fold_header(name, address)
+
+
+class SmtpConfig(NamedTuple):
+    """SMTP settings and domain of the app, as needed for sending emails."""
+
+    domain: str
+    host: str
+    port: int
+    user: str
+    password: str
+    starttls: bool
+    max_connections: int
+
+
+def _smtp_config(app: Flask) -> SmtpConfig:
+    """
+    Read the SMTP settings from the app config. This is done once per email or list message, not
+    per recipient, and not cached, so that the current config is always used.
+
+    Args:
+        app (Flask): Flask application instance
+    Returns:
+        SmtpConfig: The SMTP settings of the app
+    """
+    return SmtpConfig(
+        domain=app.config["DOMAIN"],
+        host=app.config["SMTP_HOST"],
+        port=int(app.config["SMTP_PORT"]),
+        user=app.config["SMTP_USER"],
+        password=app.config["SMTP_PASS"],
+        starttls=app.config.get("SMTP_STARTTLS", True),
+        max_connections=max(1, int(app.config.get("SMTP_MAX_CONNECTIONS", 4))),
+    )
+
+
+@lru_cache(maxsize=1)
+def _tls_context() -> ssl.SSLContext:
+    """Create the TLS context for implicit TLS connections once, as loading CA certs is costly."""
+    return ssl.create_default_context()
+
+
+def open_smtp_connection(  # noqa: PLR0913
+    smtp_host: str,
+    smtp_port: int,
+    smtp_user: str,
+    smtp_password: str,
+    smtp_starttls: bool,
+    local_hostname: str | None = None,
+) -> smtplib.SMTP:
+    """
+    Open an SMTP connection that is secured and authenticated, ready to send messages. On port
+    465, implicit TLS is used instead of STARTTLS. The caller is responsible for closing it.
+
+    Args:
+        smtp_host (str): SMTP server hostname
+        smtp_port (int): SMTP server port
+        smtp_user (str): SMTP username for authentication
+        smtp_password (str): SMTP password for authentication
+        smtp_starttls (bool): Whether to use STARTTLS (ignored with implicit TLS)
+        local_hostname (str | None): Optional local hostname for SMTP connection
+
+    Returns:
+        smtplib.SMTP: The connected SMTP server, usable as context manager
+    """
+    implicit_tls = smtp_port == SMTPS_PORT
+    if implicit_tls:
+        server = smtplib.SMTP_SSL(
+            smtp_host, smtp_port, local_hostname=local_hostname, context=_tls_context()
+        )
+    else:
+        server = smtplib.SMTP(smtp_host, smtp_port, local_hostname=local_hostname)
+    try:
+        if smtp_starttls and not implicit_tls:
+            server.starttls()
+        if smtp_user and smtp_password:
+            server.login(smtp_user, smtp_password)
+    except Exception:
+        server.close()
+        raise
+    return server
+
 
 def send_email_via_smtp(  # noqa: PLR0913
     smtp_host: str,
@@ -38,21 +156,22 @@ def send_email_via_smtp(  # noqa: PLR0913
     smtp_user: str,
     smtp_password: str,
     smtp_starttls: bool,
-    message: str,
+    message: bytes,
     from_addr: str,
     to_addrs: str,
     local_hostname: str | None = None,
 ) -> None:
     """
-    Send an email via SMTP with the given configuration.
+    Send an email via SMTP with the given configuration, using a new connection for this message
+    only. To send multiple messages over one connection, use SmtpSession.
 
     Args:
         smtp_host (str): SMTP server hostname
         smtp_port (int): SMTP server port
         smtp_user (str): SMTP username for authentication
         smtp_password (str): SMTP password for authentication
-        smtp_starttls (bool): Whether to use STARTTLS
-        message (str): Email message to send
+        smtp_starttls (bool): Whether to use STARTTLS (ignored with implicit TLS)
+        message (bytes): Serialized email message to send
         from_addr (str): Sender address (for sendmail method)
         to_addrs (str): Recipient address(es) (for sendmail method)
         local_hostname (str | None): Optional local hostname for SMTP connection
@@ -60,16 +179,278 @@ def send_email_via_smtp(  # noqa: PLR0913
     Raises:
         Exception: If sending fails
     """
-    with smtplib.SMTP(smtp_host, smtp_port, local_hostname=local_hostname) as server:
-        if smtp_starttls:
-            server.starttls()
-        if smtp_user and smtp_password:
-            server.login(smtp_user, smtp_password)
+    with open_smtp_connection(
+        smtp_host=smtp_host,
+        smtp_port=smtp_port,
+        smtp_user=smtp_user,
+        smtp_password=smtp_password,
+        smtp_starttls=smtp_starttls,
+        local_hostname=local_hostname,
+    ) as server:
         server.sendmail(from_addr=from_addr, to_addrs=to_addrs, msg=message)
 
 
+class SmtpSession:
+    """
+    SMTP connection shared by multiple messages, e.g. all recipients of a list message. It is
+    opened on the first message and reopened once if the server has dropped it in the meantime.
+    """
+
+    __slots__ = ("local_hostname", "server", "smtp_config")
+
+    def __init__(self, smtp_config: SmtpConfig, local_hostname: str | None = None) -> None:
+        """Initialize SmtpSession without connecting yet."""
+        self.smtp_config: SmtpConfig = smtp_config
+        self.local_hostname: str | None = local_hostname
+        self.server: smtplib.SMTP | None = None
+
+    def __enter__(self) -> "SmtpSession":  # noqa: PYI034
+        """Enter the context, the connection is opened on the first message."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Close the connection when leaving the context."""
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Open a new connection with the session's settings."""
+        return open_smtp_connection(
+            smtp_host=self.smtp_config.host,
+            smtp_port=self.smtp_config.port,
+            smtp_user=self.smtp_config.user,
+            smtp_password=self.smtp_config.password,
+            smtp_starttls=self.smtp_config.starttls,
+            local_hostname=self.local_hostname,
+        )
+
+    def sendmail(self, from_addr: str, to_addrs: str, message: bytes) -> None:
+        """
+        Send an email over the session's connection, connecting or reconnecting if necessary.
+
+        Args:
+            from_addr (str): Envelope sender address
+            to_addrs (str): Recipient address(es)
+            message (bytes): Serialized email message to send
+
+        Raises:
+            Exception: If sending fails
+        """
+        if self.server is None:
+            self.server = self._connect()
+        try:
+            self.server.sendmail(from_addr=from_addr, to_addrs=to_addrs, msg=message)
+        except smtplib.SMTPServerDisconnected:
+            logging.info("SMTP connection to %s was closed, reconnecting", self.smtp_config.host)
+            self.server = None
+            self.server = self._connect()
+            self.server.sendmail(from_addr=from_addr, to_addrs=to_addrs, msg=message)
+
+    def is_alive(self) -> bool:
+        """Check with a NOOP whether the open connection still accepts commands."""
+        if self.server is None:
+            return False
+        try:
+            return self.server.noop()[0] == 250  # noqa: PLR2004
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def close(self) -> None:
+        """Close the connection if open. Errors on quitting are ignored."""
+        if self.server is None:
+            return
+        server, self.server = self.server, None
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+
+class IdleSmtpSessions:
+    """
+    SMTP sessions of single emails like rejection notifications, which often come in bursts. After
+    an email has been sent, its session is kept open for a while so that the next email can reuse
+    it instead of connecting and authenticating again.
+    """
+
+    __slots__ = ("idle", "lock", "max_sessions", "timeout")
+
+    def __init__(
+        self, max_sessions: int = SMTP_IDLE_MAX_SESSIONS, timeout: float = SMTP_IDLE_TIMEOUT
+    ) -> None:
+        """Initialize IdleSmtpSessions without any sessions."""
+        self.idle: dict[tuple[SmtpConfig, str | None], list[tuple[SmtpSession, float]]] = {}
+        self.lock = threading.Lock()
+        self.max_sessions: int = max_sessions
+        self.timeout: float = timeout
+
+    def _take(self, key: tuple[SmtpConfig, str | None]) -> tuple[SmtpSession, float] | None:
+        """Take the most recently used idle session for the settings and when it was last used."""
+        with self.lock:
+            sessions = self.idle.get(key)
+            return sessions.pop() if sessions else None
+
+    @contextmanager
+    def session(
+        self, smtp_config: SmtpConfig, local_hostname: str | None = None
+    ) -> Iterator[SmtpSession]:
+        """
+        Provide a session for the given settings, reusing an idle one if it is still usable. On
+        success, the session is kept for reuse, on errors it is closed.
+
+        Args:
+            smtp_config (SmtpConfig): SMTP settings to connect with
+            local_hostname (str | None): Optional local hostname for SMTP connection
+
+        Yields:
+            SmtpSession: Session that is not in use by anyone else
+        """
+        key = (smtp_config, local_hostname)
+        while (idle := self._take(key)) is not None:
+            # Sessions unused for longer are likely dropped by the server, don't wait for it
+            if time.monotonic() - idle[1] <= self.timeout and idle[0].is_alive():
+                smtp = idle[0]
+                break
+            idle[0].close()
+        else:
+            smtp = SmtpSession(smtp_config, local_hostname=local_hostname)
+
+        try:
+            yield smtp
+        except Exception:
+            smtp.close()
+            raise
+
+        now = time.monotonic()
+        with self.lock:
+            sessions = self.idle.setdefault(key, [])
+            sessions.append((smtp, now))
+            surplus = sessions[: -self.max_sessions]
+            del sessions[: -self.max_sessions]
+            # Sessions are only taken on the next email, so also close expired ones of all settings
+            # now, instead of keeping their connections open until the relay drops them
+            surplus.extend(self._pop_expired(now))
+        for old, _last_used in surplus:
+            old.close()
+
+    def _pop_expired(self, now: float) -> list[tuple[SmtpSession, float]]:
+        """
+        Remove the sessions that have been idle for longer than the timeout. Must be called with
+        the lock held.
+
+        Args:
+            now (float): The current time.monotonic()
+
+        Returns:
+            list[tuple[SmtpSession, float]]: The removed sessions, to be closed by the caller
+        """
+        expired: list[tuple[SmtpSession, float]] = []
+        for key, sessions in list(self.idle.items()):
+            # Sessions are appended when put back, so the oldest ones come first
+            count = 0
+            while count < len(sessions) and now - sessions[count][1] > self.timeout:
+                count += 1
+            expired.extend(sessions[:count])
+            del sessions[:count]
+            if not sessions:
+                del self.idle[key]
+        return expired
+
+    def close_all(self) -> None:
+        """Close all idle sessions."""
+        with self.lock:
+            idle, self.idle = self.idle, {}
+        for sessions in idle.values():
+            for smtp, _last_used in sessions:
+                smtp.close()
+
+
+_idle_smtp_sessions = IdleSmtpSessions()
+# Log out of the relay instead of leaving the idle connections open until the process ends
+atexit.register(_idle_smtp_sessions.close_all)
+
+
+class SmtpPool:
+    """
+    Worker threads that send emails in parallel, each over one of the pool's SMTP sessions. The
+    sessions are opened on first use and kept for all following emails.
+    """
+
+    __slots__ = ("executor", "sessions")
+
+    def __init__(self, smtp_config: SmtpConfig, local_hostname: str | None = None) -> None:
+        """Initialize SmtpPool with as many sessions and workers as connections are allowed."""
+        # The most recently used session is handed out first, so that further connections are only
+        # opened if emails are actually sent in parallel
+        self.sessions: LifoQueue[SmtpSession] = LifoQueue()
+        for _session_no in range(smtp_config.max_connections):
+            self.sessions.put(SmtpSession(smtp_config, local_hostname=local_hostname))
+        self.executor = ThreadPoolExecutor(
+            max_workers=smtp_config.max_connections, thread_name_prefix="smtp"
+        )
+
+    def __enter__(self) -> "SmtpPool":  # noqa: PYI034
+        """Enter the context."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Wait for all submitted emails, then close the sessions."""
+        self.executor.shutdown(wait=True)
+        while not self.sessions.empty():
+            self.sessions.get_nowait().close()
+
+    def _run(self, send: Callable[..., None], args: tuple) -> None:
+        """Run a send function with a session that is not in use by another worker."""
+        smtp = self.sessions.get()
+        try:
+            send(*args, smtp=smtp)
+        finally:
+            self.sessions.put(smtp)
+
+    def submit(self, send: Callable[..., None], *args: object) -> "Future[None]":
+        """
+        Queue sending an email for the next free worker.
+
+        Args:
+            send (Callable[..., None]): Function that sends the email, called with args and the
+                SmtpSession to use as `smtp` keyword argument
+            *args (object): Positional arguments for send
+
+        Returns:
+            Future[None]: Future whose result() raises if sending failed
+        """
+        return self.executor.submit(self._run, send, args)
+
+
 class OutgoingEmail:
-    """Class for an email sent to multiple recipients via SMTP."""
+    """
+    Class for an email sent to multiple recipients via SMTP.
+
+    The MIME structure, common headers, body and attachments are built and serialized once per
+    message with the email package. Per recipient, only the To and X-Recipient lines are prepended
+    to these bytes, see prepare_for_recipient().
+    """
+
+    __slots__ = (
+        "app_domain",
+        "bounce_template",
+        "composed_msg",
+        "from_header",
+        "local_hostname",
+        "message_id",
+        "ml",
+        "msg",
+        "original_mid",
+        "reply_to",
+        "serialized",
+        "smtp_password",
+        "smtp_port",
+        "smtp_server",
+        "smtp_starttls",
+        "smtp_user",
+        "subscribers_emails",
+        "to_header",
+        "x_mailfrom_header",
+    )
 
     def __init__(
         self,
@@ -77,25 +458,45 @@ class OutgoingEmail:
         ml: MailingList,
         msg: MailMessage,
         message_id: str,
+        subscribers_emails: list[str] | None = None,
     ) -> None:
-        """Initialize MailerMessage."""
+        """
+        Initialize MailerMessage.
+
+        Args:
+            app (Flask): Flask application instance
+            ml (MailingList): Mailing list the message is sent to
+            msg (MailMessage): The incoming message to forward
+            message_id (str): Message-ID of the outgoing message
+            subscribers_emails (list[str] | None): Recipients of the list, if already resolved by
+                the caller. Otherwise, they are looked up in the database
+        """
         # Relevant settings from app config
-        self.app_domain: str = app.config["DOMAIN"]
-        self.smtp_server: str = app.config["SMTP_HOST"]
-        self.smtp_port: int = int(app.config["SMTP_PORT"])
-        self.smtp_user: str = app.config["SMTP_USER"]
-        self.smtp_password: str = app.config["SMTP_PASS"]
-        self.smtp_starttls: bool = app.config["SMTP_STARTTLS"]
+        smtp_config = _smtp_config(app)
+        self.app_domain: str = smtp_config.domain
+        self.smtp_server: str = smtp_config.host
+        self.smtp_port: int = smtp_config.port
+        self.smtp_user: str = smtp_config.user
+        self.smtp_password: str = smtp_config.password
+        self.smtp_starttls: bool = smtp_config.starttls
         # Arguments as class attributes
         self.message_id: str = message_id
         self.ml: MailingList = ml
         self.msg: MailMessage = msg
-        self.subscribers_emails: list[str] = list(get_list_recipients_recursive(ml.id).keys())
+        self.subscribers_emails: list[str] = (
+            subscribers_emails
+            if subscribers_emails is not None
+            else list(get_list_recipients_recursive(ml.id).keys())
+        )
         # Additional attributes we need for sending
-        self.composed_msg: MIMEMultipart | MIMEText | None = None
+        self.composed_msg: EmailMessage | None = None
+        self.serialized: bytes = b""  # composed_msg as bytes, without per-recipient headers
         self.from_header: str = ""
         self.reply_to: str = ""
+        self.to_header: str = ""  # original To addresses, recipient is added when sending
         self.original_mid: str = next(iter(self.msg.headers.get("message-id", ())), "")
+        self.local_hostname: str = self.ml.address.rsplit("@", 1)[-1]
+        self.bounce_template: tuple[str, str] = create_bounce_address_template(self.ml.address)
         self.x_mailfrom_header: str = ""
 
         # Initialize message container type, common headers, and body parts
@@ -103,54 +504,17 @@ class OutgoingEmail:
         self.prepare_common_headers()
         self.add_body_parts()
 
-    def __deepcopy__(self, memo: dict) -> "OutgoingEmail":
+    def choose_container_type(self) -> None:
         """
-        Custom deepcopy to avoid detaching SQLAlchemy objects from session.
-
-        Only deep copies msg and composed_msg to prevent cross-contamination between
-        recipients. All other attributes are either shallow-copied (immutable) or kept
-        as references (SQLAlchemy objects that must stay attached to the session).
+        Create the message container. Its MIME structure (single part, multipart/alternative or
+        multipart/mixed) follows from the body parts and attachments added in add_body_parts().
         """
-        # Create a new instance without calling __init__
-        cls = self.__class__
-        new_obj = cls.__new__(cls)
-
-        # Define which attributes should NOT be deep copied
-        no_deepcopy = {"ml", "subscribers"}  # SQLAlchemy objects - keep as references
-        deepcopy_these = {"msg", "composed_msg"}  # Must be independent per recipient
-
-        # Copy all attributes
-        for key, value in self.__dict__.items():
-            if key in deepcopy_these:
-                # Deep copy to avoid cross-contamination
-                setattr(new_obj, key, deepcopy(value, memo))
-            elif key in no_deepcopy:
-                # Keep reference (don't copy SQLAlchemy objects)
-                setattr(new_obj, key, value)
-            else:
-                # Shallow copy (immutable types like str, int are safe)
-                setattr(new_obj, key, value)
-
-        return new_obj
-
-    def choose_container_type(self) -> None:
-        """Choose the correct container type for the email based on its content."""
-        # If there are attachments, use multipart/mixed
-        if self.msg.attachments:
-            self.composed_msg = MIMEMultipart("mixed")
-        # If both text and html parts exist, use multipart/alternative
-        elif self.msg.text and self.msg.html:
-            self.composed_msg = MIMEMultipart("alternative")
-        # Otherwise, use simple MIMEText with either text or html, whichever exists
-        else:
-            self.composed_msg = MIMEText(
-                self.msg.html or self.msg.text, "html" if self.msg.html else "plain"
-            )
+        self.composed_msg = EmailMessage(policy=SMTP_POLICY)
 
     def prepare_common_headers(self) -> None:  # noqa: C901
         """Prepare common email headers, except To which is per-recipient."""
         # --- Sanity checks ---
-        if not self.composed_msg:
+        if self.composed_msg is None:
             msg = "Message container type not chosen yet"
             raise ValueError(msg)
         if not self.msg.from_values:
@@ -216,80 +580,114 @@ class OutgoingEmail:
         self.composed_msg["Sender"] = self.ml.address
         if self.x_mailfrom_header:
             self.composed_msg["X-MailFrom"] = self.x_mailfrom_header
-        # Recipients
+        # Recipients. To is set per recipient, but its original part is the same for all
+        self.to_header = ", ".join(self.msg.to)
         if self.msg.cc:
             self.composed_msg["Cc"] = ", ".join(self.msg.cc)
         # Message
         self.composed_msg["Subject"] = self.msg.subject
-        self.composed_msg["Message-ID"] = f"<{self.message_id}>"
-        self.composed_msg["Date"] = self.msg.date_str or formatdate(localtime=True)
-        self.composed_msg["Original-Message-ID"] = self.original_mid
-        # Threading and references
-        self.composed_msg["In-Reply-To"] = (
-            self.msg.headers.get("in-reply-to", ())[0]
-            if self.msg.headers.get("in-reply-to", ())
-            else self.original_mid
-        )
-        self.composed_msg["References"] = " ".join(
-            (*self.msg.headers.get("references", ()), self.original_mid)
-        )
+        self.composed_msg["Message-ID"] = f"<{self.message_id.strip('<>')}>"
+        self.composed_msg["Date"] = self._original_date_or_now()
+        self._add_threading_headers()
         if self.reply_to:
             self.composed_msg["Reply-To"] = self.reply_to
 
+    def _add_threading_headers(self) -> None:
+        """
+        Add the headers referring to the original message and its thread. Headers without a value
+        are left out, e.g. if the original message has no Message-ID.
+        """
+        if self.composed_msg is None:
+            msg = "Message container type not chosen yet"
+            raise ValueError(msg)
+        if self.original_mid:
+            self.composed_msg["Original-Message-ID"] = self.original_mid
+        if in_reply_to := next(iter(self.msg.headers.get("in-reply-to", ())), self.original_mid):
+            self.composed_msg["In-Reply-To"] = in_reply_to
+        # References may be folded over several lines, split them into the single message IDs
+        references = [
+            ref for value in self.msg.headers.get("references", ()) for ref in value.split()
+        ]
+        if self.original_mid:
+            references.append(self.original_mid)
+        if references:
+            self.composed_msg["References"] = " ".join(references)
+
+    def _original_date_or_now(self) -> str:
+        """Return the Date of the original message if it is parsable, otherwise the current date."""
+        if self.msg.date_str:
+            try:
+                parsedate_to_datetime(self.msg.date_str)
+            except (TypeError, ValueError):
+                logging.debug("Unparsable Date header in message %s, using now", self.msg.uid)
+            else:
+                return self.msg.date_str
+        return formatdate(localtime=True)
+
     def add_body_parts(self) -> None:
         """Add body parts to the email message container."""
-        if not self.composed_msg:
+        if self.composed_msg is None:
             msg = "Message container type not chosen yet"
             raise ValueError(msg)
 
-        if isinstance(self.composed_msg, MIMEMultipart):
-            if self.msg.text and self.msg.html:
-                # Combine text+html properly as an alternative part
-                alt = MIMEMultipart("alternative")
-                alt.attach(MIMEText(self.msg.text, "plain"))
-                alt.attach(MIMEText(self.msg.html, "html"))
-                self.composed_msg.attach(alt)
-            elif self.msg.text:
-                self.composed_msg.attach(MIMEText(self.msg.text, "plain"))
-            elif self.msg.html:
-                self.composed_msg.attach(MIMEText(self.msg.html, "html"))
-
-            # Add attachments if any
-            if self.msg.attachments:
-                for attachment in self.msg.attachments:
-                    part = MIMEBase(
-                        attachment.content_type.split("/")[0], attachment.content_type.split("/")[1]
-                    )
-                    part.set_payload(attachment.payload)
-                    encoders.encode_base64(part)
-                    part.add_header(
-                        "Content-Disposition",
-                        attachment.content_disposition or "attachment",
-                        filename=attachment.filename or None,
-                    )
-                    if attachment.filename:
-                        part.set_param("name", attachment.filename, header="Content-Type")
-                    self.composed_msg.attach(part)
+        # Text and/or HTML body. If both exist, they become a multipart/alternative
+        if self.msg.text and self.msg.html:
+            self.composed_msg.set_content(self.msg.text)
+            self.composed_msg.add_alternative(self.msg.html, subtype="html")
+        elif self.msg.html:
+            self.composed_msg.set_content(self.msg.html, subtype="html")
+        else:
+            self.composed_msg.set_content(self.msg.text)
 
-    def send_email_to_recipient(
-        self,
-        recipient: str,
-        dry: bool = False,
-    ) -> bytes:
+        # Add attachments if any. This turns the message into multipart/mixed
+        for attachment in self.msg.attachments:
+            maintype, _, subtype = attachment.content_type.partition("/")
+            if not maintype or not subtype:
+                logging.warning(
+                    "Malformed content type '%s' of attachment in message %s, using "
+                    "application/octet-stream",
+                    attachment.content_type,
+                    self.msg.uid,
+                )
+                maintype, subtype = "application", "octet-stream"
+            self.composed_msg.add_attachment(
+                attachment.payload,
+                maintype=maintype,
+                subtype=subtype,
+                disposition=attachment.content_disposition or "attachment",
+                filename=attachment.filename or None,
+            )
+            if attachment.filename:
+                part = self.composed_msg.get_payload()[-1]
+                part.set_param("name", attachment.filename, header="Content-Type")
+
+    def serialize(self) -> bytes:
         """
-        Sends the mostly prepared list message to a recipient. Returns sent message as bytes.
+        Serialize the composed message without per-recipient headers. This is done only once, later
+        calls return the same bytes.
+
+        Returns:
+            bytes: The composed message as bytes
+        """
+        if self.composed_msg is None:
+            return b""
+        if not self.serialized:
+            self.serialized = self.composed_msg.as_bytes()
+        return self.serialized
+
+    def prepare_for_recipient(self, recipient: str) -> bytes:
+        """
+        Add the per-recipient headers to the serialized message for sending to a recipient.
 
         Args:
             recipient (str): Recipient email address
-            dry (bool): If True, do not actually send the email
         Returns:
-            bytes: Sent message as bytes
+            bytes: Message as bytes, or empty bytes if it shall not be sent to the recipient
         """
         if self.composed_msg is None:
             logging.error("Message container not prepared, cannot send email to %s", recipient)
             return b""
 
-        # --- Add per-recipient headers ---
         # Deal with recipient as possible To/Cc of original message
         if (recipient in self.msg.to or recipient in self.msg.cc) and self.ml.avoid_duplicates:
             logging.info(
@@ -299,54 +697,113 @@ class OutgoingEmail:
             )
             return b""
         # In Broadcast mode: add recipient to To header if not already present
+        to_header = self.to_header
         if self.ml.mode == "broadcast" and recipient not in self.msg.to:
-            self.msg.to += (recipient,)
-        # Set To header: preserve original To addresses if any (minus the list address in some
-        # configurations), and recipient in any case
-        self.composed_msg["To"] = ", ".join(self.msg.to) if self.msg.to else recipient
-        # Set X-Recipient header to ease debugging
-        self.composed_msg["X-Recipient"] = recipient
+            to_header = f"{to_header}, {recipient}" if to_header else recipient
+        # The common part of the message is serialized only once, including body and attachments.
+        # The per-recipient headers are prepended to it for each recipient
+        # To header: preserve original To addresses if any (minus the list address in some
+        # configurations), and recipient in any case. X-Recipient eases debugging
+        message = (
+            _address_header("To", to_header or recipient)
+            + _address_header("X-Recipient", recipient)
+            + self.serialize()
+        )
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Email content: \n%s", message.decode(errors="replace"))
+        return message
 
-        logging.debug("Email content: \n%s", self.composed_msg.as_string())
+    def deliver(self, recipient: str, message: bytes, smtp: SmtpSession | None = None) -> None:
+        """
+        Send the serialized message to a recipient via SMTP. Unlike preparing the message, this
+        does not touch the instance and can run in parallel for multiple recipients.
 
-        # --- Send email ---
-        if dry:
-            logging.info(
-                "[DRY MODE] Would send the email to %s. Use --debug to see full email content.",
-                recipient,
-            )
-            return self.composed_msg.as_bytes()
-        try:
-            # Send the email
+        Args:
+            recipient (str): Recipient email address
+            message (bytes): Message as returned by prepare_for_recipient()
+            smtp (SmtpSession | None): SMTP session shared with other recipients. If None, a new
+                connection is opened for this recipient only
+
+        Raises:
+            Exception: If sending fails
+        """
+        from_addr = format_bounce_address(self.bounce_template, recipient)
+        if smtp is not None:
+            smtp.sendmail(from_addr=from_addr, to_addrs=recipient, message=message)
+        else:
             send_email_via_smtp(
                 smtp_host=self.smtp_server,
                 smtp_port=self.smtp_port,
                 smtp_user=self.smtp_user,
                 smtp_password=self.smtp_password,
                 smtp_starttls=self.smtp_starttls,
-                message=self.composed_msg.as_string(),
-                from_addr=create_bounce_address(ml_address=self.ml.address, recipient=recipient),
+                message=message,
+                from_addr=from_addr,
                 to_addrs=recipient,
-                local_hostname=self.ml.address.split("@")[-1],
+                local_hostname=self.local_hostname,
             )
-            logging.info("Email sent to %s", recipient)
+        logging.info("Email sent to %s", recipient)
 
-        except Exception:
-            logging.exception("Failed to send email")
-            create_log_entry(
-                level="error",
-                event="email_out",
-                message=f"Failed to send email to {recipient}",
-                details={"recipient": recipient, "message_id": self.message_id},
-                list_id=self.ml.id,
+    def log_send_failure(self, recipient: str, commit: bool = True) -> None:
+        """
+        Record the failure to send the message to a recipient in the database log.
+
+        Args:
+            recipient (str): Recipient email address
+            commit (bool): Whether to commit right away, or with the caller's next commit
+        """
+        create_log_entry(
+            level="error",
+            event="email_out",
+            message=f"Failed to send email to {recipient}",
+            details={"recipient": recipient, "message_id": self.message_id},
+            list_id=self.ml.id,
+            commit=commit,
+        )
+
+    def send_email_to_recipient(
+        self,
+        recipient: str,
+        dry: bool = False,
+        smtp: SmtpSession | None = None,
+    ) -> bytes:
+        """
+        Sends the mostly prepared list message to a recipient. Returns sent message as bytes.
+
+        Args:
+            recipient (str): Recipient email address
+            dry (bool): If True, do not actually send the email
+            smtp (SmtpSession | None): SMTP session shared with other recipients. If None, a new
+                connection is opened for this recipient only
+        Returns:
+            bytes: Sent message as bytes
+        """
+        message = self.prepare_for_recipient(recipient)
+        if not message:
+            return b""
+
+        if dry:
+            logging.info(
+                "[DRY MODE] Would send the email to %s. Use --debug to see full email content.",
+                recipient,
             )
+            return message
+        try:
+            self.deliver(recipient, message, smtp)
+        except Exception:
+            logging.exception("Failed to send email to %s", recipient)
+            self.log_send_failure(recipient)
             return b""
 
-        return self.composed_msg.as_bytes()
+        return message
 
 
-def send_msg_to_subscribers(
-    app: Flask, msg: MailMessage, ml: MailingList, mailbox: MailBox
+def send_msg_to_subscribers(  # noqa: C901, PLR0915
+    app: Flask,
+    msg: MailMessage,
+    ml: MailingList,
+    mailbox: MailBox,
+    recipients: list[str] | None = None,
 ) -> tuple[list[str], list[str]]:
     """
     Send message to all subscribers of a list. Stores sent message in Sent folder via IMAP.
@@ -356,6 +813,8 @@ def send_msg_to_subscribers(
         msg (MailMessage): The incoming message to forward
         ml (MailingList): Mailing list to send to
         mailbox (MailBox): IMAP mailbox instance for storing sent messages
+        recipients (list[str] | None): Recipient addresses of the list, if already resolved for
+            another message of the same list. If None, they are resolved from the database
 
     Returns:
         tuple[list[str], list[str]]: Tuple of lists of successful and failed recipient email
@@ -364,18 +823,40 @@ def send_msg_to_subscribers(
     sent_successful: list[str] = []
     sent_failed: list[str] = []
 
-    subscribers_emails: list[str] = list(get_list_recipients_recursive(ml.id).keys())
-    logging.info(
-        "Sending message %s to %d subscribers of list <%s>: %s",
-        msg.uid,
-        len(subscribers_emails),
-        ml.address,
-        ", ".join(subscribers_emails),
+    # Addresses are stored in lowercase, but rows from older versions or direct database edits may
+    # not be. Deduplicate case-insensitively so nobody gets the message twice, and skip addresses
+    # that cannot be delivered anyway instead of trying them via SMTP.
+    unique_emails: set[str] = set()
+    if recipients is None:
+        recipients = list(get_list_recipients_recursive(ml.id))
+    for addr in recipients:
+        if "@" not in addr.strip("@"):
+            logging.warning(
+                "Skipping invalid recipient address '%s' of list <%s>", addr, ml.address
+            )
+            continue
+        unique_emails.add(addr.lower())
+    # Group recipients by domain so that consecutive deliveries go to the same destination, which
+    # allows the relay to reuse its connections (and TLS sessions) to the recipients' MX
+    subscribers_emails: list[str] = sorted(
+        unique_emails, key=lambda addr: (addr.rsplit("@", 1)[-1], addr)
     )
+    # Only join the addresses if they are logged, lists can be large
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(
+            "Sending message %s to %d subscribers of list <%s>: %s",
+            msg.uid,
+            len(subscribers_emails),
+            ml.address,
+            ", ".join(subscribers_emails),
+        )
 
     # Prepare message class
     new_msgid = make_msgid(idstring="castmail2list", domain=ml.address.split("@")[-1]).strip("<>")
-    mail = OutgoingEmail(app=app, ml=ml, msg=msg, message_id=new_msgid)
+    # Hand over the recipients, so that the nested lists are not resolved a second time
+    mail = OutgoingEmail(
+        app=app, ml=ml, msg=msg, message_id=new_msgid, subscribers_emails=subscribers_emails
+    )
 
     # Store fundamental information about to-be-sent message in database
     email_out = EmailOut(
@@ -392,49 +873,74 @@ def send_msg_to_subscribers(
         logging.warning("No HTML or Plaintext content in message %s", msg.uid)
 
     # --- Send to each subscriber individually ---
-    for subscriber in subscribers_emails:
+    dry = app.config.get("DRY", False)
+    smtp_config = _smtp_config(app)
+
+    def finish(recipient: str, sent_msg: bytes, delivery: Future[None] | None) -> None:
+        """Wait for the delivery to a recipient, and store the sent message in the Sent folder."""
         try:
-            # Copy mail class to avoid cross-contamination between recipients
-            recipient_mail = deepcopy(mail)
-            # Send email to recipient
-            sent_msg = recipient_mail.send_email_to_recipient(
-                recipient=subscriber, dry=app.config.get("DRY", False)
+            if delivery is not None:
+                delivery.result()
+        except Exception:
+            logging.exception("Failed to send email to %s", recipient)
+            sent_failed.append(recipient)
+            # Committed together with the EmailOut entry, not once per failed recipient
+            mail.log_send_failure(recipient, commit=False)
+            return
+        sent_successful.append(recipient)
+        if dry:
+            logging.info(
+                "[DRY MODE] Would store sent message for %s in Sent folder and mark as read.",
+                recipient,
             )
-
-            # Store sent message in Sent folder via IMAP if we have one
-            if sent_msg:
-                sent_successful.append(subscriber)
-                with tempfile.NamedTemporaryFile(mode="w+", delete=True) as tmpfile:
-                    tmpfile.write(msg.obj.as_string())
-                    tmpfile.flush()
-                    logging.debug(
-                        "Saving sent message to temp file %s to be stored in Sent folder",
-                        tmpfile.name,
-                    )
-                    if app.config.get("DRY", False):
-                        logging.info(
-                            "[DRY MODE] Would store sent message for %s in Sent folder "
-                            "and mark as read.",
-                            subscriber,
-                        )
-                    else:
-                        mailbox.append(
-                            message=sent_msg,
-                            folder=app.config["IMAP_FOLDER_SENT"],
-                            flag_set=["\\Seen"],
-                        )
-            else:
+            return
+        try:
+            mailbox.append(
+                message=sent_msg, folder=app.config["IMAP_FOLDER_SENT"], flag_set=["\\Seen"]
+            )
+        except Exception:
+            sent_failed.append(recipient)
+            logging.exception("Failed to send message to %s", recipient)
+
+    # Deliver over up to SMTP_MAX_CONNECTIONS connections in parallel, so that subscribers do
+    # not wait for each other's SMTP round-trips. Preparing the per-recipient message, storing
+    # it in the Sent folder and the database stay in this thread.
+    # Every recipient needs its own SMTP transaction: the VERP envelope sender as well as the
+    # To and X-Recipient headers differ per recipient, so RCPTs cannot share one DATA.
+    with SmtpPool(smtp_config, local_hostname=mail.local_hostname) as smtp_pool:
+        # Deliveries in flight, finished in order. Bounded so that not all messages are held in
+        # memory at once for large lists
+        pending: deque[tuple[str, bytes, Future[None] | None]] = deque()
+        for subscriber in subscribers_emails:
+            try:
+                # The composed message is serialized only once, this adds per-recipient headers
+                sent_msg = mail.prepare_for_recipient(subscriber)
+            except Exception:
+                sent_failed.append(subscriber)
+                logging.exception("Failed to send message to %s", subscriber)
+                continue
+            if not sent_msg:
                 sent_failed.append(subscriber)
                 logging.warning(
                     "No sent message returned for subscriber %s, not storing in Sent folder",
                     subscriber,
                 )
-        except Exception:  # noqa: PERF203
-            sent_failed.append(subscriber)
-            logging.exception(
-                "Failed to send message to %s",
-                subscriber,
-            )
+                continue
+
+            if dry:
+                logging.info(
+                    "[DRY MODE] Would send the email to %s. Use --debug to see full email content.",
+                    subscriber,
+                )
+                pending.append((subscriber, sent_msg, None))
+            else:
+                delivery = smtp_pool.submit(mail.deliver, subscriber, sent_msg)
+                pending.append((subscriber, sent_msg, delivery))
+            while len(pending) > 2 * smtp_config.max_connections:
+                finish(*pending.popleft())
+
+        while pending:
+            finish(*pending.popleft())
 
     # Unify sent email lists and log/return results
     logging.info(
@@ -446,7 +952,9 @@ def send_msg_to_subscribers(
 
     # Update EmailOut database entry, and add to session
     email_out.subject = mail.msg.subject
-    email_out.raw = mail.composed_msg.as_string() if mail.composed_msg else ""
+    # Reuse the serialization made for sending. The message is 7bit-clean, so this equals
+    # as_string()
+    email_out.raw = mail.serialize().decode("utf-8", errors="replace")
     email_out.sent_successful = sent_successful
     email_out.sent_failed = sent_failed
     db.session.add(email_out)
@@ -484,8 +992,7 @@ def should_notify_sender(app: Flask, sender_email: str) -> bool:
 
     # If restricted to known senders only, check database
     if app.config.get("NOTIFY_REJECTED_KNOWN_ONLY", True):
-        subscriber = db.session.query(Subscriber).filter_by(email=sender_email_lower).first()
-        if subscriber:
+        if db.session.query(Subscriber.query.filter_by(email=sender_email_lower).exists()).scalar():
             logging.debug("Sender %s found in database, will notify", sender_email)
             return True
         logging.debug(
@@ -575,7 +1082,8 @@ def send_rejection_notification(  # pylint: disable=too-many-arguments
         )
 
         # Create plain text message
-        msg = MIMEText(text_body, "plain", "utf-8")
+        msg = EmailMessage(policy=SMTP_POLICY)
+        msg.set_content(text_body)
         # App
         msg["X-Mailer"] = "CastMail2List"
         msg["X-CastMail2List-Domain"] = app.config["DOMAIN"]
@@ -603,17 +1111,14 @@ def send_rejection_notification(  # pylint: disable=too-many-arguments
             )
             return True
 
-        send_email_via_smtp(
-            smtp_host=app.config["SMTP_HOST"],
-            smtp_port=app.config["SMTP_PORT"],
-            smtp_user=app.config["SMTP_USER"],
-            smtp_password=app.config["SMTP_PASS"],
-            smtp_starttls=app.config.get("SMTP_STARTTLS", True),
-            message=msg.as_string(),
-            from_addr="",  # Empty Return-Path as it's an auto response
-            to_addrs=sender_email,
-            local_hostname=app.config["DOMAIN"],
-        )
+        with _idle_smtp_sessions.session(
+            _smtp_config(app), local_hostname=app.config["DOMAIN"]
+        ) as smtp:
+            smtp.sendmail(
+                from_addr="",  # Empty Return-Path as it's an auto response
+                to_addrs=sender_email,
+                message=msg.as_bytes(),
+            )
 
     except Exception:
         logging.exception(
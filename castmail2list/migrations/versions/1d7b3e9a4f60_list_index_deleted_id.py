@@ -0,0 +1,26 @@
+"""list: index on deleted and id
+
+Revision ID: 1d7b3e9a4f60
+Revises: 5c0a9e3b7f12
+Create Date: 2026-10-16 15:12:08.318544
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1d7b3e9a4f60'
+down_revision = '5c0a9e3b7f12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('list', schema=None) as batch_op:
+        batch_op.create_index('ix_list_deleted_id', ['deleted', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('list', schema=None) as batch_op:
+        batch_op.drop_index('ix_list_deleted_id')
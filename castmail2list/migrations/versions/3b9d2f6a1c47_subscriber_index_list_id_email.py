@@ -0,0 +1,25 @@
+"""subscriber: index on list_id and email
+
+Revision ID: 3b9d2f6a1c47
+Revises: c4ad571fe783
+Create Date: 2026-10-16 10:12:41.503218
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9d2f6a1c47'
+down_revision = 'c4ad571fe783'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('subscriber', schema=None) as batch_op:
+        batch_op.create_index('ix_subscriber_list_id_email', ['list_id', 'email'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('subscriber', schema=None) as batch_op:
+        batch_op.drop_index('ix_subscriber_list_id_email')
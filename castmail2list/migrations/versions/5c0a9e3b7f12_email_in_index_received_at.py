@@ -0,0 +1,28 @@
+"""email_in: indexes on received_at, overall and per list
+
+Revision ID: 5c0a9e3b7f12
+Revises: 8e1f4c7d2a95
+Create Date: 2026-10-16 14:41:52.640173
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c0a9e3b7f12'
+down_revision = '8e1f4c7d2a95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('email_in', schema=None) as batch_op:
+        batch_op.create_index('ix_email_in_received_at', [sa.text('received_at DESC')], unique=False)
+        batch_op.create_index('ix_email_in_list_id_received_at', ['list_id', sa.text('received_at DESC')], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('email_in', schema=None) as batch_op:
+        batch_op.drop_index('ix_email_in_list_id_received_at')
+        batch_op.drop_index('ix_email_in_received_at')
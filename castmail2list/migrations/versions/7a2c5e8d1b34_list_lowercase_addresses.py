@@ -0,0 +1,40 @@
+"""list: store addresses in lowercase
+
+Revision ID: 7a2c5e8d1b34
+Revises: 1d7b3e9a4f60
+Create Date: 2026-10-16 16:03:27.914502
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7a2c5e8d1b34'
+down_revision = '1d7b3e9a4f60'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Lowercasing would violate the unique constraint on the address if two lists only differ in
+    # the casing of their address, so abort with the clashing lists instead
+    clashes = op.get_bind().execute(sa.text(
+        "SELECT id, address FROM list WHERE lower(address) IN"
+        " (SELECT lower(address) FROM list GROUP BY lower(address) HAVING count(*) > 1)"
+        " ORDER BY lower(address), id"
+    )).all()
+    if clashes:
+        details = ", ".join(f"{list_id} ({address})" for list_id, address in clashes)
+        raise RuntimeError(
+            "Cannot store list addresses in lowercase, these lists have addresses that only differ "
+            f"in casing: {details}. Change the addresses so that they are unique and retry."
+        )
+
+    # New addresses are lowercased by the model, lists are looked up by the lowercase address
+    op.execute("UPDATE list SET address = lower(address) WHERE address != lower(address)")
+
+
+def downgrade():
+    # The original casing is not kept, lowercase addresses are valid for older revisions as well
+    pass
@@ -0,0 +1,25 @@
+"""subscriber: index on email and list_id
+
+Revision ID: 8e1f4c7d2a95
+Revises: 3b9d2f6a1c47
+Create Date: 2026-10-16 14:03:27.118406
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8e1f4c7d2a95'
+down_revision = '3b9d2f6a1c47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('subscriber', schema=None) as batch_op:
+        batch_op.create_index('ix_subscriber_email_list_id', ['email', 'list_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('subscriber', schema=None) as batch_op:
+        batch_op.drop_index('ix_subscriber_email_list_id')
@@ -4,16 +4,31 @@
 
 """Database models for CastMail2List."""
 
+import sqlite3
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from flask_login import UserMixin
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import ForeignKeyConstraint, MetaData, PrimaryKeyConstraint
+from sqlalchemy import ForeignKeyConstraint, Index, MetaData, PrimaryKeyConstraint, inspect
 from sqlalchemy.orm import DeclarativeBase, Mapped, deferred, validates
 
 
-class Base(DeclarativeBase):
+class MappedAttributeKeys:
+    """Mixin that caches the names of the mapped attributes of each model class once."""
+
+    _mapped_attribute_keys: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Collect the mapped attribute names of a newly mapped model class."""
+        super().__init_subclass__(**kwargs)
+        if "__mapper__" in cls.__dict__:
+            # Unlike Mapper.attrs, this does not configure the mappers, which would fail for
+            # relationships to models that are not yet defined
+            cls._mapped_attribute_keys = frozenset(inspect(cls).all_orm_descriptors.keys())
+
+
+class Base(MappedAttributeKeys, DeclarativeBase):
     """Base class for all models with naming convention for constraints."""
 
     metadata = MetaData(
@@ -26,14 +41,49 @@ class Base(DeclarativeBase):
         }
     )
 
+    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize a model with values for its mapped attributes."""
+        for key, value in kwargs.items():
+            if key not in self._mapped_attribute_keys:
+                msg = f"Unexpected keyword argument {key!r} for {self.__class__.__name__}"
+                raise TypeError(msg)
+            setattr(self, key, value)
+
 
 db = SQLAlchemy(model_class=Base)
 if TYPE_CHECKING:
-    from flask_sqlalchemy.model import Model
+    from flask_sqlalchemy.model import Model as FlaskModel
+
+    class Model(FlaskModel, Base):
+        """Type of db.Model, which combines Flask-SQLAlchemy's Model with Base."""
+
 else:
     Model = db.Model
 
 
+def set_sqlite_pragmas(dbapi_connection: object, _connection_record: object) -> None:
+    """Configure new SQLite connections for concurrent access and faster commits.
+
+    The write-ahead log lets the web app read while the IMAP worker writes, and with it
+    synchronous=NORMAL is safe against corruption while saving an fsync on every commit.
+
+    To be registered as "connect" listener on the app's engine only, not on all engines. Other
+    databases than SQLite are left untouched.
+    """
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
+def _now_utc() -> datetime:
+    """Return the current time in UTC, as default for timestamp columns at insert time."""
+    return datetime.now(timezone.utc)
+
+
 class AlembicVersion(Model):
     """Alembic version table mapping."""
 
@@ -55,15 +105,6 @@ class User(Model, UserMixin):
         role (str): Role of the user, e.g., "admin".
     """
 
-    def __init__(self, **kwargs: str | int) -> None:
-        """Initialize User."""
-        # Only set attributes that actually exist on the mapped class
-        for key, value in kwargs.items():
-            if not hasattr(self.__class__, key):
-                msg = f"Unexpected keyword argument {key!r} for {self.__class__.__name__}"
-                raise TypeError(msg)
-            setattr(self, key, value)
-
     id: int = db.Column(db.Integer, primary_key=True)
     username: str = db.Column(db.String(100), unique=True, nullable=False)
     password: str = db.Column(db.String, nullable=False)
@@ -97,15 +138,6 @@ class MailingList(Model):
 
     __tablename__ = "list"
 
-    def __init__(self, **kwargs: str | int | bool | list) -> None:
-        """Initialize MailingList."""
-        # Only set attributes that actually exist on the mapped class
-        for key, value in kwargs.items():
-            if not hasattr(self.__class__, key):
-                msg = f"Unexpected keyword argument {key!r} for {self.__class__.__name__}"
-                raise TypeError(msg)
-            setattr(self, key, value)
-
     id: str = db.Column(db.String, primary_key=True)
     display: str = db.Column(db.String, nullable=True)
     address: str = db.Column(db.String, unique=True, nullable=False)  # Ensure it's not null
@@ -124,21 +156,26 @@ class MailingList(Model):
     imap_user: str = db.Column(db.String, nullable=False)
     imap_pass: str = db.Column(db.String, nullable=False)
 
-    # Subscribers and messages relationships
+    # Subscribers and messages relationships. The reverse sides are declared on the other models, so
+    # the loading strategy can be chosen per direction
     subscribers = db.relationship(
-        "Subscriber", backref="list", lazy="select", cascade="all, delete-orphan"
+        "Subscriber", back_populates="list", lazy="select", cascade="all, delete-orphan"
     )
     emailin = db.relationship(
-        "EmailIn", backref="list", lazy="select", cascade="all, delete-orphan"
+        "EmailIn", back_populates="list", lazy="select", cascade="all, delete-orphan"
     )
     emailout = db.relationship(
-        "EmailOut", backref="list", lazy="select", cascade="all, delete-orphan"
+        "EmailOut", back_populates="list", lazy="select", cascade="all, delete-orphan"
     )
 
     # Soft-delete flag: mark list as deleted instead of removing row from DB
     deleted: bool = db.Column(db.Boolean, default=False)
     deleted_at = db.Column(db.DateTime, nullable=True)
 
+    # Active and deactivated lists are shown ordered by ID. The index serves both the filter and the
+    # order, so neither a table scan nor a sort is needed
+    __table_args__ = (Index("ix_list_deleted_id", "deleted", "id"),)
+
     def deactivate(self) -> None:
         """Mark the mailing list as deleted."""
         self.deleted = True
@@ -176,17 +213,9 @@ class Subscriber(Model):
         email (str): Email address of the subscriber.
         comment (str): Optional comment about the subscriber.
         subscriber_type (str): Type of subscriber, either "normal" or "list".
+        list (relationship): Relationship to the MailingList model.
     """
 
-    def __init__(self, **kwargs: str | int) -> None:
-        """Initialize Subscriber."""
-        # Only set attributes that actually exist on the mapped class
-        for key, value in kwargs.items():
-            if not hasattr(self.__class__, key):
-                msg = f"Unexpected keyword argument {key!r} for {self.__class__.__name__}"
-                raise TypeError(msg)
-            setattr(self, key, value)
-
     id: int = db.Column(db.Integer, primary_key=True)
     list_id: str = db.Column(
         db.String, db.ForeignKey("list.id", onupdate="CASCADE"), nullable=False
@@ -197,6 +226,8 @@ class Subscriber(Model):
     subscriber_type: str = db.Column(db.String, default="normal")  # subscriber or list
     bounces: int = db.Column(db.Integer, nullable=False, default=0)
 
+    list = db.relationship("MailingList", back_populates="subscribers", lazy="select")
+
     @validates("email")
     def _validate_email(self, _: str, value: str) -> str:
         """Normalize email to lowercase on set so comparisons/queries are case-insensitive, and
@@ -211,6 +242,13 @@ class Subscriber(Model):
         """Increase bounce count by 1."""
         self.bounces += 1
 
+    # Subscribers are looked up by list for every sent message, and by list and email when managing
+    # them. Subscriptions of an address across all lists are looked up by email only
+    __table_args__ = (
+        Index("ix_subscriber_list_id_email", "list_id", "email"),
+        Index("ix_subscriber_email_list_id", "email", "list_id"),
+    )
+
 
 class EmailIn(Model):
     """An email message sent to a mailing list.
@@ -225,19 +263,11 @@ class EmailIn(Model):
         received_at (datetime): Timestamp when the email was received.
         status (str): Processing status of the email.
         error_info (dict): Optional error information if processing failed.
+        list (relationship): Relationship to the MailingList model.
     """
 
     __tablename__ = "email_in"
 
-    def __init__(self, **kwargs: str) -> None:
-        """Initialize EmailIn."""
-        # Only set attributes that actually exist on the mapped class
-        for key, value in kwargs.items():
-            if not hasattr(self.__class__, key):
-                msg = f"Unexpected keyword argument {key!r} for {self.__class__.__name__}"
-                raise TypeError(msg)
-            setattr(self, key, value)
-
     message_id: str = db.Column(db.String, nullable=False)
     list_id: str = db.Column(
         db.String, db.ForeignKey("list.id", onupdate="CASCADE"), nullable=False
@@ -246,13 +276,21 @@ class EmailIn(Model):
     from_addr: str = db.Column(db.String, nullable=True)
     headers: Mapped[str] = deferred(db.Column(db.Text, nullable=False))
     raw: Mapped[str] = deferred(db.Column(db.Text))  # store full RFC822 text
-    received_at: Mapped[datetime] = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    received_at: Mapped[datetime] = db.Column(db.DateTime, default=_now_utc)
     status: str = db.Column(
         db.String
     )  # "ok", "bounce-msg", "sender-not-allowed", "sender-auth-failed", "duplicate"
     error_info: dict = db.Column(db.JSON, default=dict)
 
-    __table_args__ = (PrimaryKeyConstraint("message_id", "list_id", name="pk_email_in"),)
+    list = db.relationship("MailingList", back_populates="emailin", lazy="select")
+
+    __table_args__ = (
+        PrimaryKeyConstraint("message_id", "list_id", name="pk_email_in"),
+        # Messages are listed newest first, overall and per list. The indexes allow reading them in
+        # this order instead of sorting the whole table
+        Index("ix_email_in_received_at", received_at.desc()),
+        Index("ix_email_in_list_id_received_at", "list_id", received_at.desc()),
+    )
 
 
 class EmailOut(Model):
@@ -268,19 +306,11 @@ class EmailOut(Model):
         sent_at (datetime): Timestamp when the email was sent.
         sent_successful (list): List of email addresses the email was successfully sent to.
         sent_failed (list): List of email addresses the email failed to send to.
+        list (relationship): Relationship to the MailingList model.
     """
 
     __tablename__ = "email_out"
 
-    def __init__(self, **kwargs: str | int | list | datetime) -> None:
-        """Initialize EmailOut."""
-        # Only set attributes that actually exist on the mapped class
-        for key, value in kwargs.items():
-            if not hasattr(self.__class__, key):
-                msg = f"Unexpected keyword argument {key!r} for {self.__class__.__name__}"
-                raise TypeError(msg)
-            setattr(self, key, value)
-
     message_id: str = db.Column(db.String, unique=True, nullable=False, primary_key=True)
     email_in_mid: str = db.Column(db.String, nullable=False)
     list_id: str = db.Column(
@@ -289,10 +319,12 @@ class EmailOut(Model):
     subject: str = db.Column(db.String, nullable=True)
     recipients: list = db.Column(db.JSON, default=list)
     raw: Mapped[str] = deferred(db.Column(db.Text))  # store full RFC822 text
-    sent_at: Mapped[datetime] = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    sent_at: Mapped[datetime] = db.Column(db.DateTime, default=_now_utc)
     sent_successful: list = db.Column(db.JSON, default=list)
     sent_failed: list = db.Column(db.JSON, default=list)
 
+    list = db.relationship("MailingList", back_populates="emailout", lazy="select")
+
     # Composite foreign key to EmailIn (message_id, list_id)
     __table_args__ = (
         ForeignKeyConstraint(
@@ -316,17 +348,8 @@ class Logs(Model):
         list_id (str): Foreign key to the associated mailing list, if applicable.
     """
 
-    def __init__(self, **kwargs: Any) -> None:  # noqa: ANN401
-        """Initialize Logs."""
-        # Only set attributes that actually exist on the mapped class
-        for key, value in kwargs.items():
-            if not hasattr(self.__class__, key):
-                msg = f"Unexpected keyword argument {key!r} for {self.__class__.__name__}"
-                raise TypeError(msg)
-            setattr(self, key, value)
-
     id: int = db.Column(db.Integer, primary_key=True)
-    timestamp: Mapped[datetime] = db.Column(db.DateTime, default=datetime.now(timezone.utc))
+    timestamp: Mapped[datetime] = db.Column(db.DateTime, default=_now_utc)
     level: str = db.Column(db.String, nullable=False)  # Severity: "info", "warning", "error"
     event: str = db.Column(db.String, nullable=False)  # Event type: "sent-msg", "login-attempt"
     message: str = db.Column(db.Text, nullable=False)  # Short log message
@@ -11,22 +11,44 @@ It may serve as setting up a demo instance, or allows to pre-seed productive dat
 import json
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from alembic.config import Config as AlembicConfig
-from alembic.script import ScriptDirectory
-from flask import Flask
+from flask import Flask, current_app
+from sqlalchemy import insert, select
 from werkzeug.security import generate_password_hash
 
 from .models import AlembicVersion, MailingList, Subscriber, User, db
 
+# Number of subscribers inserted per statement when seeding
+SEED_BATCH_SIZE = 5000
+
+
+@lru_cache(maxsize=1)
+def _get_alembic_head() -> str | None:
+    """Get the head revision of the migrations.
+
+    Determining it parses all migration scripts, so the result is cached. The migrations ship with
+    the package and do not change while it runs.
+
+    Returns:
+        str | None: The head revision, or None if there are no migrations
+    """
+    # Alembic is only needed here, so it is imported when actually seeding
+    from alembic.config import Config as AlembicConfig  # noqa: PLC0415
+    from alembic.script import ScriptDirectory  # noqa: PLC0415
+
+    alembic_cfg = AlembicConfig()
+    alembic_cfg.set_main_option("script_location", "castmail2list:migrations")
+    return ScriptDirectory.from_config(alembic_cfg).get_current_head()
+
 
 def _load_local_seed(seed_file: str) -> dict[str, Any]:
-    """Try to import from a JSON file; return empty dict if not present."""
+    """Load the seed data from a JSON file; exit if it is missing or invalid."""
     try:
-        with Path(seed_file).open(encoding="utf-8") as f:
-            return json.load(f)
+        return json.loads(Path(seed_file).read_bytes())
     except FileNotFoundError:
         logging.critical("No local seed file found at %s.", seed_file)
         sys.exit(1)
@@ -43,14 +65,14 @@ def seed_database(app: Flask, seed_file: str) -> None:  # noqa: C901, PLR0915
 
     Args:
         app (Flask): Optional Flask app to push context for seeding
-        seed_file (str): Path to a seed file (.py file)
+        seed_file (str): Path to a seed file (.json file)
     """
 
     def _do_seed() -> None:  # noqa: C901, PLR0912, PLR0915
         # ensure tables exist (app caller should have context)
         db.create_all()
 
-        if MailingList.query.first():
+        if db.session.scalar(select(MailingList.id).limit(1)) is not None:
             logging.warning("Database already has lists — skipping seed.")
             return
 
@@ -60,6 +82,7 @@ def seed_database(app: Flask, seed_file: str) -> None:  # noqa: C901, PLR0915
 
         cfg_lists_raw = cfg.get("lists", [])
         cfg_lists: list[dict[str, Any]] = cfg_lists_raw if isinstance(cfg_lists_raw, list) else []
+        sub_rows: list[dict[str, str | None]] = []
         for lst_cfg in cfg_lists:
             if not isinstance(lst_cfg, dict):
                 continue
@@ -71,7 +94,6 @@ def seed_database(app: Flask, seed_file: str) -> None:  # noqa: C901, PLR0915
                 "display",
                 "mode",
                 "imap_host",
-                "imap_port",
                 "imap_user",
                 "imap_pass",
                 "from_addr",
@@ -81,16 +103,26 @@ def seed_database(app: Flask, seed_file: str) -> None:  # noqa: C901, PLR0915
                 if isinstance(value, (str, int, bool, list)):
                     list_kwargs[field] = value
 
+            # The port may also be given as string. Fall back to the default port if it is missing
+            # or invalid, like for lists created via the web interface
+            imap_port = lst_cfg.get("imap_port")
+            if isinstance(imap_port, str) and imap_port.strip().isdigit():
+                list_kwargs["imap_port"] = int(imap_port)
+            elif isinstance(imap_port, int) and not isinstance(imap_port, bool):
+                list_kwargs["imap_port"] = imap_port
+            else:
+                list_kwargs["imap_port"] = current_app.config["IMAP_DEFAULT_PORT"]
+
             only_subscribers_send = lst_cfg.get("only_subscribers_send", True)
             list_kwargs["only_subscribers_send"] = (
                 only_subscribers_send if isinstance(only_subscribers_send, bool) else True
             )
 
             new_list = MailingList(**list_kwargs)
+            db.session.add(new_list)
 
             cfg_subs_raw = lst_cfg.get("subscribers", [])
             cfg_subs: list[dict[str, Any]] = cfg_subs_raw if isinstance(cfg_subs_raw, list) else []
-            subs: list[Subscriber] = []
             for s in cfg_subs:
                 if not isinstance(s, dict):
                     continue
@@ -98,28 +130,39 @@ def seed_database(app: Flask, seed_file: str) -> None:  # noqa: C901, PLR0915
                 email = s.get("email")
                 if not isinstance(email, str):
                     continue
+                # The rows are inserted in bulk, bypassing the model's validation of the address.
+                # Normalize it here the same way as addresses added via the web interface or API
+                email = email.strip().lower()
+                if "@" not in email:
+                    logging.warning("Skipping subscriber with invalid email address: %s", email)
+                    continue
 
-                sub_kwargs: dict[str, str | int] = {
-                    "email": email,
-                    "list_id": new_list.id,
-                }
-
+                # All rows of an executemany need the same keys, so optional values are always set
                 name = s.get("name")
-                if isinstance(name, str):
-                    sub_kwargs["name"] = name
-
                 subscriber_type = s.get("subscriber_type")
-                if isinstance(subscriber_type, str):
-                    sub_kwargs["subscriber_type"] = subscriber_type
-
-                subs.append(Subscriber(**sub_kwargs))
-
-            db.session.add(new_list)
-            if subs:
-                db.session.add_all(subs)
+                sub_rows.append(
+                    {
+                        "email": email,
+                        "list_id": new_list.id,
+                        "name": name if isinstance(name, str) else None,
+                        "subscriber_type": (
+                            subscriber_type if isinstance(subscriber_type, str) else "normal"
+                        ),
+                    }
+                )
+
+        # Subscribers may be many, so insert them via a Core executemany against the table instead
+        # of as ORM objects, in batches to bound the size of a single statement. The lists need to
+        # exist first because of the foreign key
+        if sub_rows:
+            db.session.flush()
+            sub_table = Subscriber.__table__
+            for start in range(0, len(sub_rows), SEED_BATCH_SIZE):
+                db.session.execute(insert(sub_table), sub_rows[start : start + SEED_BATCH_SIZE])
 
         cfg_user_raw = cfg.get("users", [])
         cfg_user: list[dict[str, Any]] = cfg_user_raw if isinstance(cfg_user_raw, list) else []
+        user_rows: list[dict[str, str | None]] = []
         for user_cfg in cfg_user:
             if not isinstance(user_cfg, dict):
                 continue
@@ -131,30 +174,36 @@ def seed_database(app: Flask, seed_file: str) -> None:  # noqa: C901, PLR0915
             password = user_cfg.get("password", "")
             password_str = password if isinstance(password, str) else ""
 
-            user_kwargs: dict[str, str | int] = {
-                "username": username,
-                "password": generate_password_hash(password=password_str),
-            }
-
+            # All rows of an executemany need the same keys, so optional values are always set
             api_key = user_cfg.get("api_key")
-            if isinstance(api_key, str):
-                user_kwargs["api_key"] = api_key
-
-            new_user = User(**user_kwargs)
-            db.session.add(new_user)
+            user_rows.append(
+                {
+                    "username": username,
+                    "password": password_str,
+                    "api_key": api_key if isinstance(api_key, str) else None,
+                }
+            )
 
-        # Get the latest alembic revision and write it into DB
+        # Hashing a password is deliberately slow. The key derivation releases the GIL, so hash the
+        # passwords of all users in parallel instead of one after another. Then insert all users
+        # with a single executemany, like the subscribers
+        if user_rows:
+            with ThreadPoolExecutor() as executor:
+                hashes = executor.map(
+                    generate_password_hash, [str(row["password"]) for row in user_rows]
+                )
+                for user_row, password_hash in zip(user_rows, hashes, strict=True):
+                    user_row["password"] = password_hash
+            db.session.execute(insert(User.__table__), user_rows)
+
+        # Write the latest alembic revision into DB if needed
         try:
-            alembic_cfg = AlembicConfig()
-            alembic_cfg.set_main_option("script_location", "castmail2list:migrations")
-            script = ScriptDirectory.from_config(alembic_cfg)
-            head_revision = script.get_current_head()
-            if not head_revision:
-                msg = "No head revision found in Alembic scripts"
-                raise ValueError(msg)  # noqa: TRY301
-            logging.info("Latest Alembic revision: %s", head_revision)
-            # Write into alembic_version table if needed
-            if not AlembicVersion.query.first():
+            if db.session.scalar(select(AlembicVersion.version_num).limit(1)) is None:
+                head_revision = _get_alembic_head()
+                if not head_revision:
+                    msg = "No head revision found in Alembic scripts"
+                    raise ValueError(msg)  # noqa: TRY301
+                logging.info("Latest Alembic revision: %s", head_revision)
                 alembic_version = AlembicVersion(version_num=head_revision)
                 db.session.add(alembic_version)
         except Exception as e:
@@ -7,6 +7,8 @@
 import logging
 
 from flask_babel import _
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
 
 from .models import MailingList, Subscriber, db
 from .utils import is_email_a_list, validate_email
@@ -43,6 +45,36 @@ def get_lists(show_deactivated: bool = False) -> dict[str, dict]:
 # -----------------------------------------------------------------
 
 
+def _get_list_and_subscriber(
+    list_id: str, email: str = "", subscriber_id: int | None = None
+) -> tuple[MailingList | None, Subscriber | None]:
+    """
+    Get a mailing list and a subscriber in a single query.
+
+    Args:
+        list_id (str): The ID of the mailing list
+        email (str): The normalized email address of the subscriber on this list
+        subscriber_id (int): The ID of the subscriber on this list instead of the email
+
+    Returns:
+        tuple[MailingList | None, Subscriber | None]: The mailing list, or None if it does not
+            exist, and the subscriber, or None if it was not found
+    """
+    # Subscribers of other lists are not loaded, and are treated like missing ones
+    if subscriber_id is not None:
+        sub_condition = (Subscriber.list_id == MailingList.id) & (Subscriber.id == subscriber_id)
+    else:
+        sub_condition = (Subscriber.list_id == MailingList.id) & (Subscriber.email == email)
+    row = db.session.execute(
+        select(MailingList, Subscriber)
+        .outerjoin(Subscriber, sub_condition)
+        .where(MailingList.id == list_id)
+    ).first()
+    if row is None:
+        return None, None
+    return row[0], row[1]
+
+
 def add_subscriber_to_list(list_id: str, email: str, name: str = "", comment: str = "") -> str:
     """
     Add a new subscriber to a mailing list.
@@ -63,20 +95,19 @@ def add_subscriber_to_list(list_id: str, email: str, name: str = "", comment: st
     Returns:
         str: An error message if any issues occur, otherwise empty string on success
     """
-    # Verify list exists
-    mailing_list: MailingList | None = MailingList.query.filter_by(id=list_id).first()
-    if not mailing_list:
-        return f"Mailing list with ID {list_id} not found"
-
     # Normalize email
     email = email.strip().lower()
 
+    # Verify list exists, and get an existing subscription of the email in the same query
+    mailing_list, existing_subscriber = _get_list_and_subscriber(list_id, email)
+    if not mailing_list:
+        return f"Mailing list with ID {list_id} not found"
+
     # Validate email
     if not validate_email(email):
         return f"Invalid email address: {email}"
 
     # Check if subscriber already exists
-    existing_subscriber = Subscriber.query.filter_by(list_id=list_id, email=email).first()
     if existing_subscriber:
         return f"Email {email} is already subscribed to list {list_id}"
 
@@ -100,7 +131,7 @@ def add_subscriber_to_list(list_id: str, email: str, name: str = "", comment: st
         db.session.add(new_subscriber)
         db.session.commit()
         logging.info('Subscriber "%s" added to mailing list %s', email, mailing_list.address)
-    except Exception as e:
+    except SQLAlchemyError as e:
         db.session.rollback()
         logging.exception('Failed to add subscriber "%s" to list %s', email, list_id)
         return _("Database error: ") + str(e)
@@ -108,7 +139,7 @@ def add_subscriber_to_list(list_id: str, email: str, name: str = "", comment: st
         return ""
 
 
-def update_subscriber_in_list(list_id: str, subscriber_id: int, **kwargs: str) -> str:  # noqa: C901, PLR0911, PLR0912
+def update_subscriber_in_list(list_id: str, subscriber_id: int, **kwargs: str) -> str:  # noqa: C901, PLR0912
     """
     Update an existing subscriber in a mailing list.
 
@@ -120,17 +151,14 @@ def update_subscriber_in_list(list_id: str, subscriber_id: int, **kwargs: str) -
     Returns:
         str: An error message if any issues occur, otherwise empty string on success
     """
-    # Verify list exists
-    mailing_list: MailingList | None = MailingList.query.filter_by(id=list_id).first()
+    # Verify list and subscriber exist, in a single query
+    mailing_list, subscriber = _get_list_and_subscriber(list_id, subscriber_id=subscriber_id)
     if mailing_list is None:
         return f"Mailing list with ID {list_id} not found"
 
-    # Verify subscriber exists and belongs to this list
-    subscriber: Subscriber | None = Subscriber.query.get(subscriber_id)
+    # Verify subscriber exists on this list
     if subscriber is None:
-        return f"Subscriber with ID {subscriber_id} not found"
-    if subscriber.list_id != list_id:
-        return f"Subscriber {subscriber_id} does not belong to list {list_id}"
+        return f"Subscriber with ID {subscriber_id} not found on list {list_id}"
 
     # Get updated fields or keep existing
     name_new = kwargs.get("name")
@@ -138,18 +166,23 @@ def update_subscriber_in_list(list_id: str, subscriber_id: int, **kwargs: str) -
     comment_new = kwargs.get("comment")
     subscriber_type_new = None  # use existing type unless email changes
 
-    # Special case: update of email, check for conflicts
-    if email_new and email_new != subscriber.email:
+    # Special case: update of email, check for conflicts. Normalize first, so that an unchanged
+    # address in different casing does not need to be validated and checked again
+    if email_new:
         email_new = email_new.strip().lower()
+    if email_new and email_new != subscriber.email:
         # Validate new email
         if not validate_email(email_new):
             return f"Invalid email address: {email_new}"
 
         # Check if new email conflicts with existing subscriber on the same list (but not itself)
-        existing_subscriber: Subscriber | None = Subscriber.query.filter_by(
-            list_id=list_id, email=email_new
-        ).first()
-        if existing_subscriber and existing_subscriber.id != subscriber_id:
+        if db.session.query(
+            Subscriber.query.filter(
+                Subscriber.list_id == list_id,
+                Subscriber.email == email_new,
+                Subscriber.id != subscriber_id,
+            ).exists()
+        ).scalar():
             return f'Email "{email_new}" is already subscribed to this list'
 
         # Check if subscriber's new email is an existing list. If so, set type and re-use name
@@ -178,7 +211,7 @@ def update_subscriber_in_list(list_id: str, subscriber_id: int, **kwargs: str) -
         logging.info(
             'Subscriber "%s" updated in mailing list %s', subscriber.email, mailing_list.address
         )
-    except Exception as e:
+    except SQLAlchemyError as e:
         db.session.rollback()
         logging.exception("Failed to update subscriber %s in list %s", subscriber_id, list_id)
         return _("Database error: ") + str(e)
@@ -197,19 +230,14 @@ def delete_subscriber_from_list(list_id: str, subscriber_email: str) -> str:
     Returns:
         str: An error message if any issues occur, otherwise empty string on success
     """
-    # Verify list exists
-    mailing_list: MailingList | None = MailingList.query.filter_by(id=list_id).first()
+    # Verify list and subscriber exist, in a single query
+    mailing_list, subscriber = _get_list_and_subscriber(list_id, subscriber_email)
     if mailing_list is None:
         return f"Mailing list with ID {list_id} not found"
 
-    # Verify subscriber exists and belongs to this list
-    subscriber: Subscriber | None = Subscriber.query.filter_by(
-        list_id=list_id, email=subscriber_email
-    ).first()
+    # Verify subscriber exists on this list
     if not subscriber:
         return f"Subscriber with email {subscriber_email} not found on list {list_id}"
-    if subscriber.list_id != list_id:
-        return f"Subscriber {subscriber_email} does not belong to list {list_id}"
 
     try:
         db.session.delete(subscriber)
@@ -217,7 +245,7 @@ def delete_subscriber_from_list(list_id: str, subscriber_email: str) -> str:
         logging.info(
             'Subscriber "%s" removed from mailing list %s', subscriber_email, mailing_list.address
         )
-    except Exception as e:
+    except SQLAlchemyError as e:
         db.session.rollback()
         logging.exception("Failed to delete subscriber %s from list %s", subscriber_email, list_id)
         return _("Database error: ") + str(e)
@@ -238,17 +266,14 @@ def get_subscriber_by_id(list_id: str, subscriber_id: int) -> tuple[Subscriber |
             - On success: (Subscriber object, None)
             - On failure: (None, error message string)
     """
-    # Verify list exists
-    mailing_list: MailingList | None = MailingList.query.filter_by(id=list_id).first()
+    # Verify list and subscriber exist, in a single query
+    mailing_list, subscriber = _get_list_and_subscriber(list_id, subscriber_id=subscriber_id)
     if not mailing_list:
         return None, f"Mailing list with ID {list_id} not found"
 
-    # Verify subscriber exists and belongs to this list
-    subscriber: Subscriber | None = Subscriber.query.get(subscriber_id)
+    # Verify subscriber exists on this list
     if not subscriber:
-        return None, f"Subscriber with ID {subscriber_id} not found"
-    if subscriber.list_id != list_id:
-        return None, f"Subscriber {subscriber_id} does not belong to list {list_id}"
+        return None, f"Subscriber with ID {subscriber_id} not found on list {list_id}"
 
     return subscriber, None
 
@@ -264,13 +289,5 @@ def get_subscriber_by_email(list_id: str, subscriber_email: str) -> Subscriber |
     Returns:
         Subscriber | None: Subscriber object if found, otherwise None
     """
-    # Verify subscriber exists and belongs to this list
-    subscriber: Subscriber | None = Subscriber.query.filter_by(
-        list_id=list_id, email=subscriber_email
-    ).first()
-    if not subscriber:
-        return None
-    if subscriber.list_id != list_id:
-        return None
-
-    return subscriber
+    # The subscriber is looked up on this list, so it always belongs to it
+    return Subscriber.query.filter_by(list_id=list_id, email=subscriber_email).first()
@@ -4,12 +4,17 @@
 
 """Functions and operations to collect reports about different parts of Castmail2List."""
 
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import case, distinct, func
+
 from . import __version__
-from .models import MailingList
+from .models import MailingList, Subscriber
 from .utils import (
+    count_incoming_messages,
+    count_outgoing_messages,
     get_all_incoming_messages,
     get_all_outgoing_messages,
-    get_all_subscribers,
     get_log_entries,
 )
 
@@ -20,46 +25,68 @@ def lists_count() -> dict:
     Returns:
         dict: A dictionary containing status information about mailing lists.
     """
+    # Let the database count all and the deactivated lists in one row, instead of loading all lists.
+    # SUM over CASE instead of an aggregate FILTER clause, which not all supported databases know
+    total, deactivated = MailingList.query.with_entities(
+        func.count(MailingList.id),
+        func.coalesce(func.sum(case((MailingList.deleted.is_(True), 1), else_=0)), 0),
+    ).one()
     list_stats: dict[str, int] = {
-        "total": 0,
-        "active": 0,
-        "deactivated": 0,
+        "total": total,
+        "active": total - deactivated,
+        "deactivated": deactivated,
     }
-    all_lists: list[MailingList] = MailingList.query.all()
-    list_stats["total"] = len(all_lists)
-    for mailing_list in all_lists:
-        if getattr(mailing_list, "deleted", True):
-            list_stats["deactivated"] += 1
-        else:
-            list_stats["active"] += 1
 
     return list_stats
 
 
+def subscribers_count() -> int:
+    """Counts unique subscriber email addresses across all mailing lists.
+
+    Returns:
+        int: The number of unique subscribers.
+    """
+    return (
+        Subscriber.query.join(Subscriber.list)
+        .with_entities(func.count(distinct(Subscriber.email)))
+        .scalar()
+        or 0
+    )
+
+
 def status_complete() -> dict:  # pylint: disable=too-many-locals
     """Collects overall status information about Castmail2List.
 
     Returns:
         dict: A dictionary containing overall status information.
     """
-    email_in_all = get_all_incoming_messages(only="ok")
-    email_in_hours_24 = get_all_incoming_messages(only="ok", days=1)
+    # The complete history is only counted and its newest entries fetched, instead of loading it.
+    # The entries of the last 24 hours are taken from those of the last 7 days, which saves a
+    # query per kind of entry
+    hours_24 = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(days=1)
+    email_in_last_5 = get_all_incoming_messages(only="ok", limit=5)
     email_in_days_7 = get_all_incoming_messages(only="ok", days=7)
-    bounce_hours_24 = get_all_incoming_messages(only="bounces", days=1)
+    email_in_hours_24 = [msg for msg in email_in_days_7 if msg.received_at >= hours_24]
     bounce_days_7 = get_all_incoming_messages(only="bounces", days=7)
-    bounce_last_5 = get_all_incoming_messages(only="bounces")[:5]
-    email_in_fail_all = get_all_incoming_messages(only="failures")
-    email_in_fail_hours_24 = get_all_incoming_messages(only="failures", days=1)
+    bounce_hours_24 = [msg for msg in bounce_days_7 if msg.received_at >= hours_24]
+    bounce_last_5 = get_all_incoming_messages(only="bounces", limit=5)
+    email_in_fail_last_5 = get_all_incoming_messages(only="failures", limit=5)
     email_in_fail_days_7 = get_all_incoming_messages(only="failures", days=7)
-    email_out_all = get_all_outgoing_messages()
-    email_out_hours_24 = get_all_outgoing_messages(days=1)
+    email_in_fail_hours_24 = [msg for msg in email_in_fail_days_7 if msg.received_at >= hours_24]
+    email_out_last_5 = get_all_outgoing_messages(limit=5)
     email_out_days_7 = get_all_outgoing_messages(days=7)
-    errors_hours_24 = get_log_entries(exact=True, days=1, level="error")
-    errors_days_7 = get_log_entries(exact=True, days=7, level="error")
-    errors_last_5 = get_log_entries(exact=True, level="error")[:5]
-    warnings_hours_24 = get_log_entries(exact=True, days=1, level="warning")
-    warnings_days_7 = get_log_entries(exact=True, days=7, level="warning")
-    warnings_last_5 = get_log_entries(exact=True, level="warning")[:5]
+    email_out_hours_24 = [msg for msg in email_out_days_7 if msg.sent_at >= hours_24]
+    # Only load the log columns that are reported
+    log_fields = ("id", "timestamp")
+    log_fields_last_5 = ("id", "timestamp", "event", "message")
+    errors_days_7 = get_log_entries(exact=True, days=7, fields=log_fields, level="error")
+    errors_hours_24 = [log for log in errors_days_7 if log.timestamp >= hours_24]
+    errors_last_5 = get_log_entries(exact=True, limit=5, fields=log_fields_last_5, level="error")
+    warnings_days_7 = get_log_entries(exact=True, days=7, fields=log_fields, level="warning")
+    warnings_hours_24 = [log for log in warnings_days_7 if log.timestamp >= hours_24]
+    warnings_last_5 = get_log_entries(
+        exact=True, limit=5, fields=log_fields_last_5, level="warning"
+    )
 
     status: dict = {
         "_version_app": __version__,
@@ -67,10 +94,10 @@ def status_complete() -> dict:  # pylint: disable=too-many-locals
             "count": lists_count(),
         },
         "subscribers": {
-            "count": len(get_all_subscribers()),
+            "count": subscribers_count(),
         },
         "email_in": {
-            "count": len(email_in_all),
+            "count": count_incoming_messages(only="ok"),
             "hours_24": [
                 {
                     "mid": msg.message_id,
@@ -96,11 +123,11 @@ def status_complete() -> dict:  # pylint: disable=too-many-locals
                     "subject": msg.subject,
                     "received_at": msg.received_at,
                 }
-                for msg in email_in_all[:5]
+                for msg in email_in_last_5
             ],
         },
         "email_in_failures": {
-            "count": len(email_in_fail_all),
+            "count": count_incoming_messages(only="failures"),
             "hours_24": [
                 {
                     "mid": msg.message_id,
@@ -129,7 +156,7 @@ def status_complete() -> dict:  # pylint: disable=too-many-locals
                     "status": msg.status,
                     "received_at": msg.received_at,
                 }
-                for msg in email_in_fail_all[:5]
+                for msg in email_in_fail_last_5
             ],
         },
         "bounces": {
@@ -162,7 +189,7 @@ def status_complete() -> dict:  # pylint: disable=too-many-locals
             ],
         },
         "email_out": {
-            "count": len(email_out_all),
+            "count": count_outgoing_messages(),
             "hours_24": [
                 {
                     "mid": msg.message_id,
@@ -191,7 +218,7 @@ def status_complete() -> dict:  # pylint: disable=too-many-locals
                     "sent_failed": len(msg.sent_failed),
                     "sent_at": msg.sent_at,
                 }
-                for msg in email_out_all[:5]
+                for msg in email_out_last_5
             ],
         },
         "errors": {
@@ -14,21 +14,27 @@ import sysconfig
 import uuid
 from datetime import datetime, timedelta, timezone
 from email.utils import formataddr
+from functools import lru_cache
 from pathlib import Path
 
 import email_validator  # dependency for WTForms email validator
-from flask import Flask, flash
+from flask import Flask, flash, g, has_request_context
 from flask_babel import _
+from flask_sqlalchemy.query import Query
 from imap_tools import EmailAddress, MailBox, MailboxLoginError
 from imap_tools.message import MailMessage
 from platformdirs import user_config_path
-from sqlalchemy import func
+from sqlalchemy import func, or_
+from sqlalchemy.orm import load_only, raiseload, selectinload, undefer
 
 from castmail2list.forms import MailingListForm, SubscriberAddForm
 
 from . import __version__
 from .models import EmailIn, EmailOut, Logs, MailingList, Subscriber, db
 
+# Separators of values in comma or newline separated strings, e.g. pasted email addresses
+LIST_SEPARATOR_RE = re.compile(r"[,\n]+")
+
 
 def _compile_scss_system(compiler: str, scss_input: str, css_output: str) -> None:
     """Compile SCSS files to CSS using the system-installed Sass compiler.
@@ -93,8 +99,30 @@ def _compile_scss(scss_input: str, css_output: str) -> None:
         _compile_scss_embedded(scss_input=scss_input, css_output=css_output)
 
 
+def _is_css_up_to_date(scss_input: str, css_output: str) -> bool:
+    """Check whether the compiled CSS is newer than its SCSS input and all SCSS files it may import.
+
+    Imported files are not parsed; instead, all SCSS files in the directory of the input and below
+    are considered.
+
+    Args:
+        scss_input (str): Absolute path to the SCSS input file.
+        css_output (str): Absolute path to the CSS output file.
+
+    Returns:
+        bool: True if the CSS output exists and no SCSS file has been changed since
+    """
+    try:
+        css_mtime = Path(css_output).stat().st_mtime
+        scss_mtime = max(path.stat().st_mtime for path in Path(scss_input).parent.rglob("*.scss"))
+    except (OSError, ValueError):
+        # Missing output or input
+        return False
+    return css_mtime >= scss_mtime
+
+
 def compile_scss_on_startup(scss_files: list[tuple[str, str]]) -> list[tuple[str, str]]:
-    """Compile SCSS to CSS on application startup.
+    """Compile SCSS to CSS on application startup, unless the CSS is already up to date.
 
     Args:
         scss_files (list[tuple[str, str]]): List of tuples with relative paths
@@ -106,7 +134,11 @@ def compile_scss_on_startup(scss_files: list[tuple[str, str]]) -> list[tuple[str
     for scss_input, css_output in scss_files:
         scss_input_abs = str(curpath / Path(scss_input))
         css_output_abs = str(curpath / Path(css_output))
-        _compile_scss(scss_input=scss_input_abs, css_output=css_output_abs)
+        # Avoid starting the compiler, e.g. on every reload in debug mode, if nothing has changed
+        if _is_css_up_to_date(scss_input=scss_input_abs, css_output=css_output_abs):
+            logging.debug("%s is up to date, not compiling %s", css_output_abs, scss_input_abs)
+        else:
+            _compile_scss(scss_input=scss_input_abs, css_output=css_output_abs)
         compiled_files.append((scss_input_abs, css_output_abs))
     return compiled_files
 
@@ -136,6 +168,22 @@ def redact(value: str) -> str:
     return value[:visible] + "*" * (len(value) - visible)
 
 
+@lru_cache(maxsize=1)
+def _get_git_commit() -> str:
+    """
+    Get the short git commit hash of the application. It does not change while the process runs,
+    so git is only called once, also when multiple apps are created, e.g. web app and worker.
+
+    Returns:
+        str: The short commit hash, or "unknown commit" if it cannot be determined
+    """
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()  # noqa: S607
+    except Exception:
+        logging.debug("Failed to get git commit hash.", exc_info=True)
+        return "unknown commit"
+
+
 def get_version_info(debug: bool = False) -> str:
     """
     Get the current version information of the application. If in debug mode, include git commit
@@ -151,23 +199,13 @@ def get_version_info(debug: bool = False) -> str:
     if not debug:
         return __version__
     # Get short git commit hash if available
-    try:
-        commit = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"]).decode().strip()  # noqa: S607
-    except Exception:
-        logging.debug("Failed to get git commit hash.", exc_info=True)
-        commit = "unknown commit"
-
-    return f"{__version__} ({commit})"
+    return f"{__version__} ({_get_git_commit()})"
 
 
 def normalize_email_list(input_str: str) -> str:
-    """Normalize a string of emails into a comma-separated list."""
+    """Normalize a string of emails into a comma-separated list without duplicates."""
     # Accepts either comma or newline separated, returns comma-separated
-    if not input_str:
-        return ""
-    # Replace newlines with commas, then split
-    emails = [email.strip() for email in input_str.replace("\n", ",").split(",") if email.strip()]
-    return ", ".join(emails)
+    return ", ".join(string_to_list(input_str))
 
 
 def list_to_string(listobj: list[str]) -> str:
@@ -180,25 +218,56 @@ def list_to_string(listobj: list[str]) -> str:
 
 def string_to_list(input_str: str, lower: bool = False) -> list[str]:
     """
-    Normalize a string of strings into a list.
+    Normalize a string of strings into a list. Duplicates, e.g. from pasting the same address
+    twice, are removed, keeping the order of first occurrence.
 
     Args:
         input_str (str): Input string with comma or newline separated values
         lower (bool): Whether to convert all strings to lowercase
     Returns:
-        list[str]: List of normalized strings
+        list[str]: List of normalized, unique strings
     """
     # Accepts either comma or newline separated, returns list of strings
     if not input_str:
         return []
-    # Replace newlines with commas, then split
-    strings = [
-        string.strip() for string in input_str.replace("\n", ",").split(",") if string.strip()
-    ]
-    # Optionally convert to lowercase
+    # Split at any run of separators, and strip each value only once
+    strings = (string for part in LIST_SEPARATOR_RE.split(input_str) if (string := part.strip()))
+    # Optionally convert to lowercase, before removing duplicates
     if lower:
-        strings = [s.lower() for s in strings]
-    return strings
+        strings = (s.lower() for s in strings)
+    return list(dict.fromkeys(strings))
+
+
+def create_bounce_address_template(ml_address: str) -> tuple[str, str]:
+    """
+    Construct the template for the individualized Envelope From addresses of a mailing list, to be
+    filled via format_bounce_address(). It consists of the parts before and after the recipient.
+
+    For the list address `list1@list.example.com`, the return will be
+    `("list1+bounces--", "@list.example.com")`
+
+    Args:
+        ml_address (str): The mailing list email address
+    Returns:
+        tuple[str, str]: The Envelope From parts before and after the recipient
+    """
+    local_part, _, domain_part = ml_address.partition("@")
+    return f"{local_part}+bounces--", f"@{domain_part}"
+
+
+def format_bounce_address(template: tuple[str, str], recipient: str) -> str:
+    """
+    Fill a template created by create_bounce_address_template() with the given recipient.
+
+    Args:
+        template (tuple[str, str]): The Envelope From template of the mailing list
+        recipient (str): The recipient email address
+    Returns:
+        str: The constructed Envelope From address
+    """
+    # Two str.replace() calls are several times faster than str.translate() for short addresses,
+    # and concatenation avoids parsing a format string for every recipient
+    return template[0] + recipient.replace("@", "=").replace("+", "---plus---") + template[1]
 
 
 def create_bounce_address(ml_address: str, recipient: str) -> str:
@@ -214,9 +283,7 @@ def create_bounce_address(ml_address: str, recipient: str) -> str:
     Returns:
         str: The constructed Envelope From address
     """
-    local_part, domain_part = ml_address.split("@", 1)
-    sanitized_recipient = recipient.replace("@", "=").replace("+", "---plus---")
-    return f"{local_part}+bounces--{sanitized_recipient}@{domain_part}"
+    return format_bounce_address(create_bounce_address_template(ml_address), recipient)
 
 
 def parse_bounce_address(bounce_address: str) -> str | None:
@@ -232,16 +299,15 @@ def parse_bounce_address(bounce_address: str) -> str | None:
     Returns:
         (str | None): The parsed recipient email address, or None if parsing fails
     """
-    try:
-        local_part, _ = bounce_address.split("@", 1)
-        if "+bounces--" not in local_part:
-            logging.debug("No bounce marker in address: %s", bounce_address)
-            return None
-        _, sanitized_recipient = local_part.split("+bounces--", 1)
-        return sanitized_recipient.replace("=", "@").replace("---plus---", "+")
-    except ValueError:
+    local_part, at, _ = bounce_address.partition("@")
+    if not at:
         logging.warning("Failed to parse bounce address: %s", bounce_address)
         return None
+    _, marker, sanitized_recipient = local_part.partition("+bounces--")
+    if not marker:
+        logging.debug("No bounce marker in address: %s", bounce_address)
+        return None
+    return sanitized_recipient.replace("=", "@").replace("---plus---", "+")
 
 
 def generate_via_from_header(
@@ -289,30 +355,64 @@ def is_email_a_list(email: str) -> MailingList | None:
 
     It also removes any +suffix before checking.
 
+    Within a request, all list addresses are loaded once and cached on `flask.g` for the rest of
+    the request, as views and bulk imports check many addresses in a row.
+
     Args:
         email (str): The email address to check
     Returns:
         The MailingList object if the email is a list address, None otherwise
     """
-    email = remove_plus_suffix(email)
-    if ml := MailingList.query.filter(func.lower(MailingList.address) == func.lower(email)).first():
+    email = remove_plus_suffix(email).lower()
+    if has_request_context():
+        if "lists_by_address" not in g:
+            g.lists_by_address = get_lists_by_address()
+        return g.lists_by_address.get(email)
+    # Outside of requests, e.g. in the long-running IMAP worker, lists may change between calls.
+    # List addresses are stored in lowercase, so compare directly which can use the unique index on
+    # the address instead of lowercasing every row
+    if ml := MailingList.query.filter(MailingList.address == email).first():
         return ml
     return None
 
 
+def get_lists_by_address() -> dict[str, MailingList]:
+    """
+    Get all configured active or inactive mailing lists by their lowercase address. This allows
+    checking many email addresses like is_email_a_list() with a single query, by looking up
+    `remove_plus_suffix(email).lower()` in the result.
+
+    Returns:
+        dict[str, MailingList]: A mapping of lowercase list address to MailingList object
+    """
+    return {ml.address.lower(): ml for ml in MailingList.query.all()}
+
+
+def get_list_addresses() -> set[str]:
+    """
+    Get the lowercase addresses of all configured active or inactive mailing lists. Like
+    get_lists_by_address(), but for membership checks only, so only the address column is loaded.
+
+    Returns:
+        set[str]: The lowercase list addresses
+    """
+    return {address.lower() for (address,) in MailingList.query.with_entities(MailingList.address)}
+
+
 def get_list_by_id(list_id: str) -> MailingList | None:
     """
-    Get a mailing list by its ID.
+    Get a mailing list by its ID. The lookup uses the session's identity map, so repeated calls for
+    the same list within a request or job do not query the database again.
 
     Args:
         list_id (str): The ID of the mailing list
     Returns:
         MailingList | None: The MailingList object if found, None otherwise
     """
-    return MailingList.query.filter_by(id=list_id).first()
+    return db.session.get(MailingList, list_id)
 
 
-def get_list_recipients_recursive(  # noqa: C901
+def get_list_recipients_recursive(  # noqa: C901, PLR0912
     list_id: str, only_direct: bool = False, only_indirect: bool = False
 ) -> dict[str, dict]:
     """
@@ -337,54 +437,67 @@ def get_list_recipients_recursive(  # noqa: C901
     """
     visited_list_ids = set()
     recipients_dict: dict[str, dict] = {}
+    # Recipients that are lists themselves
+    list_emails: set[str] = set()
+
+    # Load all lists once, instead of querying for each recipient whether it is a list. The list
+    # itself is then taken from the session without another query
+    lists_by_address = get_lists_by_address()
 
     ml = get_list_by_id(list_id)
     if not ml:
         logging.warning("Mailing list with ID %s not found.", list_id)
         return recipients_dict
 
-    def _collect_recipients(list_obj: MailingList, is_direct: bool = False) -> None:
-        """Recursively collect subscribers from the given mailing list and nested lists."""
-        if list_obj.id in visited_list_ids:  # list already visited, avoid recursion
-            return
-        visited_list_ids.add(list_obj.id)  # Mark this list as visited
-
-        # Exclude deleted lists
-        if list_obj.deleted:
-            return
-
-        # Get direct subscribers
-        direct_subs: list[Subscriber] = Subscriber.query.filter_by(list_id=list_obj.id).all()
-        for rec in direct_subs:
-            # Add subscriber if not already added
-            if rec.email not in recipients_dict:
-                recipients_dict[rec.email] = {
-                    "id": rec.id,
-                    "name": rec.name,
-                    "email": rec.email,
-                    "source": ["direct"] if is_direct else [list_obj.id],
-                }
-            # Update source list
-            elif is_direct:
-                if "direct" not in recipients_dict[rec.email]["source"]:
-                    recipients_dict[rec.email]["source"].append("direct")
-            elif list_obj.id not in recipients_dict[rec.email]["source"]:
-                recipients_dict[rec.email]["source"].append(list_obj.id)
-
-        # Iterate over direct recipients. If any is a list, recurse into it
-        for rec in direct_subs:
-            if (
-                nested_list := is_email_a_list(rec.email)
-            ) and nested_list.id not in visited_list_ids:
-                _collect_recipients(nested_list, is_direct=False)
-
-    # Start collecting from the given mailing list
-    _collect_recipients(ml, is_direct=True)
+    # Walk through the nested lists level by level, so that the subscribers of all lists on one
+    # level are loaded with a single query instead of one query per list
+    visited_list_ids.add(ml.id)
+    level: list[MailingList] = [ml]
+    is_direct = True
+    while level:
+        # Exclude deleted lists, and do not descend into them
+        level = [list_obj for list_obj in level if not list_obj.deleted]
+        if not level:
+            break
+
+        # Get direct subscribers. Only the needed columns are loaded, as plain rows instead of full
+        # ORM objects, which matters for large lists
+        subs_by_list_id: dict[str, list] = {list_obj.id: [] for list_obj in level}
+        for rec in Subscriber.query.with_entities(
+            Subscriber.list_id, Subscriber.id, Subscriber.name, Subscriber.email
+        ).filter(Subscriber.list_id.in_(subs_by_list_id)):
+            subs_by_list_id[rec.list_id].append(rec)
+
+        next_level: list[MailingList] = []
+        for list_obj in level:
+            source = "direct" if is_direct else list_obj.id
+            for rec in subs_by_list_id[list_obj.id]:
+                # Add subscriber if not already added, otherwise update its source lists
+                entry = recipients_dict.get(rec.email)
+                if entry is None:
+                    recipients_dict[rec.email] = {
+                        "id": rec.id,
+                        "name": rec.name,
+                        "email": rec.email,
+                        "source": [source],
+                    }
+                elif source not in entry["source"]:
+                    entry["source"].append(source)
+
+                # If the recipient is a list, remember it for removal, and collect its subscribers
+                # on the next level
+                if nested_list := lists_by_address.get(remove_plus_suffix(rec.email).lower()):
+                    list_emails.add(rec.email)
+                    if nested_list.id not in visited_list_ids:
+                        visited_list_ids.add(nested_list.id)
+                        next_level.append(nested_list)
+
+        level = next_level
+        is_direct = False
 
     # Remove any recipient whose email is a list address (do not send to lists themselves)
-    for email in list(recipients_dict.keys()):
-        if is_email_a_list(email):
-            del recipients_dict[email]
+    for email in list_emails:
+        del recipients_dict[email]
 
     # Filter based on only_direct / only_indirect flags
     if only_direct and only_indirect:
@@ -406,13 +519,15 @@ def get_list_recipients_recursive(  # noqa: C901
     # Sort by email
     recipients_dict = dict(sorted(recipients_dict.items(), key=lambda item: item[0]))
 
-    logging.debug(
-        "Found %d unique, non-list recipients (after optional filters) with details for the list "
-        "<%s>: %s",
-        len(recipients_dict),
-        ml.address,
-        ", ".join(recipients_dict.keys()),
-    )
+    # Only join the addresses if they are logged, lists can be large
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(
+            "Found %d unique, non-list recipients (after optional filters) with details for the "
+            "list <%s>: %s",
+            len(recipients_dict),
+            ml.address,
+            ", ".join(recipients_dict.keys()),
+        )
 
     return recipients_dict
 
@@ -442,29 +557,37 @@ def get_list_subscribers(list_id: str, exclude_lists: bool = False) -> dict[str,
         logging.warning("Mailing list with ID %s not found.", list_id)
         return subscribers_dict
 
-    # Get direct subscribers
-    direct_subs: list[Subscriber] = (
-        Subscriber.query.order_by(Subscriber.email).filter_by(list_id=ml.id).all()
+    # Get direct subscribers. Only the needed columns are loaded, as plain rows instead of full ORM
+    # objects, which matters for large lists
+    direct_subs = (
+        Subscriber.query.with_entities(
+            Subscriber.id,
+            Subscriber.name,
+            Subscriber.email,
+            Subscriber.comment,
+            Subscriber.subscriber_type,
+            Subscriber.list_id,
+        )
+        .order_by(Subscriber.email)
+        .filter_by(list_id=ml.id)
+        .all()
     )
+    list_addresses = get_list_addresses() if exclude_lists else set()
     for sub in direct_subs:
         # Skip if subscriber is a list and include_lists is False
-        if exclude_lists and is_email_a_list(sub.email):
+        if exclude_lists and remove_plus_suffix(sub.email).lower() in list_addresses:
             continue
-        subscribers_dict[sub.email] = {
-            "id": sub.id,
-            "name": sub.name,
-            "email": sub.email,
-            "comment": sub.comment,
-            "subscriber_type": sub.subscriber_type,
-            "list_id": sub.list_id,
-        }
-
-    logging.debug(
-        "Found %d direct subscribers (after optional filters) with details for the list <%s>: %s",
-        len(subscribers_dict),
-        ml.address,
-        ", ".join(subscribers_dict.keys()),
-    )
+        # The row's keys are the selected column names
+        subscribers_dict[sub.email] = sub._asdict()
+
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(
+            "Found %d direct subscribers (after optional filters) with details for the list "
+            "<%s>: %s",
+            len(subscribers_dict),
+            ml.address,
+            ", ".join(subscribers_dict.keys()),
+        )
 
     return subscribers_dict
 
@@ -481,10 +604,13 @@ def get_all_subscribers() -> dict[str, dict[str, list[MailingList] | int]]:
     """
     subscriber_map: dict[str, dict] = {}
 
-    all_lists: list[MailingList] = MailingList.query.all()
+    # The subscribers relationship is loaded lazily by default. Load it for all lists in one
+    # additional query here, instead of one query per list
+    all_lists: list[MailingList] = MailingList.query.options(
+        selectinload(MailingList.subscribers)
+    ).all()
     for ml in all_lists:
-        subscribers: list[Subscriber] = Subscriber.query.filter_by(list_id=ml.id).all()
-        for sub in subscribers:
+        for sub in ml.subscribers:
             if sub.email not in subscriber_map:
                 subscriber_map[sub.email] = {"lists": [], "bounces": 0}
             subscriber_map[sub.email]["lists"].append(ml)
@@ -535,17 +661,16 @@ def is_expanded_address_the_mailing_list(to_address: str, list_address: str) ->
     Returns:
         bool: True if the address matches the mailing list address, False otherwise
     """
-    to_local_part, to_domain_part = to_address.split("@", 1)
-    list_local_part, list_domain_part = list_address.split("@", 1)
+    # partition() does not build lists, and does not fail for addresses without "@"
+    to_local_part, _, to_domain_part = to_address.partition("@")
+    list_local_part, _, list_domain_part = list_address.partition("@")
 
     # Check domain parts (case-insensitive)
     if to_domain_part.lower() != list_domain_part.lower():
         return False
 
     # Check local parts (case-insensitive, ignoring +suffix)
-    to_local_part_no_suffix = to_local_part.split("+", 1)[0].lower()
-
-    return to_local_part_no_suffix == list_local_part.lower()
+    return to_local_part.partition("+")[0].lower() == list_local_part.lower()
 
 
 def run_only_once(app: Flask) -> bool:
@@ -715,11 +840,45 @@ def get_user_config_path(name: str = "castmail2list", file: str = "") -> str:
     return str(config_path)
 
 
-def get_all_incoming_messages(only: str = "", days: int = 0) -> list[EmailIn]:
+def _incoming_messages_query(only: str = "", days: int = 0) -> Query:
+    """
+    Build the query for incoming messages, filtered by status and date in the database.
+
+    Args:
+        only (str): Filter the messages, see get_all_incoming_messages()
+        days (int): Only include messages from the last given number of days. If 0, include all
+    Returns:
+        Query: The filtered, unordered query
+    """
+    if only not in ("", "bounces", "failures", "ok"):
+        logging.critical("Invalid 'only' parameter for get_all_messages: %s", only)
+        msg = f"Invalid 'only' parameter: {only}"
+        raise ValueError(msg)
+    query = EmailIn.query
+    if only == "bounces":
+        query = query.filter(EmailIn.status == "bounce-msg")
+    if only == "failures":
+        query = query.filter(
+            or_(EmailIn.status.is_(None), EmailIn.status.not_in(("ok", "bounce-msg")))
+        )
+    if only == "ok":
+        query = query.filter(EmailIn.status == "ok")
+    if days > 0:
+        cutoff_date = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+        query = query.filter(EmailIn.received_at >= cutoff_date)
+    return query
+
+
+def get_all_incoming_messages(
+    only: str = "", days: int = 0, load_list: bool = False, limit: int = 0
+) -> list[EmailIn]:
     """
     Get all incoming messages from the database. With options to filter for bounce messages and by
     date.
 
+    Relationships of the messages are not loaded lazily but raise an error, so that accessing them
+    per message cannot go unnoticed. Use `load_list` if the mailing lists are needed.
+
     Args:
         only (str): Filter the messages
             * If "ok", return only successful
@@ -727,41 +886,90 @@ def get_all_incoming_messages(only: str = "", days: int = 0) -> list[EmailIn]:
             * If "failures", return only failure messages (except bounces)
             * If empty, return all messages
         days (int): Only return messages from the last given number of days. If 0, return all
+        load_list (bool): Load the mailing list of all messages in one additional query
+        limit (int): Only return the given number of newest messages. If 0, return all
 
     Returns:
         list[Message]: A list of all requested messages, descending by received date
     """
-    if only not in ("", "bounces", "failures", "ok"):
-        logging.critical("Invalid 'only' parameter for get_all_messages: %s", only)
-        msg = f"Invalid 'only' parameter: {only}"
-        raise ValueError(msg)
-    all_messages: list[EmailIn] = EmailIn.query.order_by(EmailIn.received_at.desc()).all()
-    if only == "bounces":
-        all_messages = [msg for msg in all_messages if msg.status == "bounce-msg"]
-    if only == "failures":
-        all_messages = [msg for msg in all_messages if msg.status not in ("ok", "bounce-msg")]
-    if only == "ok":
-        all_messages = [msg for msg in all_messages if msg.status == "ok"]
+    query = _incoming_messages_query(only=only, days=days)
+    if load_list:
+        query = query.options(selectinload(EmailIn.list))
+    query = query.options(raiseload("*")).order_by(EmailIn.received_at.desc())
+    if limit > 0:
+        query = query.limit(limit)
+    return query.all()
+
+
+def count_incoming_messages(only: str = "", days: int = 0) -> int:
+    """
+    Count incoming messages in the database, without loading them. The filters are the same as in
+    get_all_incoming_messages().
+
+    Args:
+        only (str): Filter the messages, see get_all_incoming_messages()
+        days (int): Only count messages from the last given number of days. If 0, count all
+
+    Returns:
+        int: The number of matching messages
+    """
+    query = _incoming_messages_query(only=only, days=days)
+    return query.with_entities(func.count(EmailIn.message_id)).scalar() or 0
+
+
+def _outgoing_messages_query(days: int = 0) -> Query:
+    """
+    Build the query for outgoing messages, filtered by date in the database.
+
+    Args:
+        days (int): Only include messages from the last given number of days. If 0, include all
+    Returns:
+        Query: The filtered, unordered query
+    """
+    query = EmailOut.query
     if days > 0:
         cutoff_date = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(days=days)
-        all_messages = [msg for msg in all_messages if msg.received_at >= cutoff_date]
-    return all_messages
+        query = query.filter(EmailOut.sent_at >= cutoff_date)
+    return query
 
 
-def get_all_outgoing_messages(days: int = 0) -> list[EmailOut]:
+def get_all_outgoing_messages(
+    days: int = 0, load_list: bool = False, limit: int = 0
+) -> list[EmailOut]:
     """
     Get all outgoing messages from the database. With option to filter by date.
 
+    As with get_all_incoming_messages(), relationships raise an error instead of being loaded
+    lazily.
+
     Args:
         days (int): Only return messages from the last given number of days. If 0, return all
+        load_list (bool): Load the mailing list of all messages in one additional query
+        limit (int): Only return the given number of newest messages. If 0, return all
     Returns:
         list[EmailOut]: A list of all requested outgoing messages, descending by sent date
     """
-    all_messages: list[EmailOut] = EmailOut.query.order_by(EmailOut.sent_at.desc()).all()
-    if days > 0:
-        cutoff_date = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(days=days)
-        all_messages = [msg for msg in all_messages if msg.sent_at >= cutoff_date]
-    return all_messages
+    query = _outgoing_messages_query(days=days)
+    if load_list:
+        query = query.options(selectinload(EmailOut.list))
+    query = query.options(raiseload("*")).order_by(EmailOut.sent_at.desc())
+    if limit > 0:
+        query = query.limit(limit)
+    return query.all()
+
+
+def count_outgoing_messages(days: int = 0) -> int:
+    """
+    Count outgoing messages in the database, without loading them.
+
+    Args:
+        days (int): Only count messages from the last given number of days. If 0, count all
+
+    Returns:
+        int: The number of matching messages
+    """
+    query = _outgoing_messages_query(days=days)
+    return query.with_entities(func.count(EmailOut.message_id)).scalar() or 0
 
 
 def get_all_messages_id_from_raw_email(raw_email: str) -> list[str]:
@@ -773,18 +981,23 @@ def get_all_messages_id_from_raw_email(raw_email: str) -> list[str]:
     Returns:
         list[str]: A list of Message-ID/Original-Message-ID found in the email
     """
-    message_ids = []
-    for line in raw_email.splitlines():
-        if line.lower().startswith("message-id:") or line.lower().startswith(
-            "original-message-id:"
-        ):
-            _, msg_id = line.split(":", 1)
-            message_ids.append(msg_id.strip().strip("<>"))
-    return message_ids
+    # Bounces may contain long lines, e.g. of the original body. Only lowercase the start of each
+    # line that is relevant for the header names
+    prefixes = ("message-id:", "original-message-id:")
+    max_prefix_len = len(prefixes[1])
+    return [
+        line.split(":", 1)[1].strip().strip("<>")
+        for line in raw_email.splitlines()
+        if line[:max_prefix_len].lower().startswith(prefixes)
+    ]
 
 
-def get_message_id_in_db(
-    message_ids: list[str], only: str = "", list_id: str = ""
+def get_message_id_in_db(  # noqa: C901
+    message_ids: list[str],
+    only: str = "",
+    list_id: str = "",
+    load_raw: bool = False,
+    load_list: bool = False,
 ) -> list[EmailIn | EmailOut]:
     """
     Check if any of the given Message-IDs exist in the database as either incoming or outgoing
@@ -798,6 +1011,9 @@ def get_message_id_in_db(
         message_ids (list[str]): A list of Message-IDs to check
         only (str): "in" to check only incoming messages, "out" for outgoing. Empty for both
         list_id (str): If given, only check messages connected to this mailing list ID
+        load_raw (bool): If True, load the deferred raw message text in the same query, e.g. for
+            showing the message
+        load_list (bool): If True, eagerly load the associated mailing list of each message
 
     Returns:
         list: A list of found EmailIn or EmailOut objects matching any of the given Message-IDs.
@@ -812,12 +1028,22 @@ def get_message_id_in_db(
 
     if only in ("", "in"):
         for msg_id in message_ids:
-            msg_in: list[EmailIn] = EmailIn.query.filter_by(message_id=msg_id).all()
+            query_in = EmailIn.query.filter_by(message_id=msg_id)
+            if load_raw:
+                query_in = query_in.options(undefer(EmailIn.raw))
+            if load_list:
+                query_in = query_in.options(selectinload(EmailIn.list))
+            msg_in: list[EmailIn] = query_in.all()
             found_messages.extend(msg_in)
 
     if only in ("", "out"):
         for msg_id in message_ids:
-            msg_out: list[EmailOut] = EmailOut.query.filter_by(message_id=msg_id).all()
+            query_out = EmailOut.query.filter_by(message_id=msg_id)
+            if load_raw:
+                query_out = query_out.options(undefer(EmailOut.raw))
+            if load_list:
+                query_out = query_out.options(selectinload(EmailOut.list))
+            msg_out: list[EmailOut] = query_out.all()
             found_messages.extend(msg_out)
 
     if list_id:
@@ -843,15 +1069,18 @@ def get_message_id_from_incoming(msg: MailMessage) -> str:
         str: The Message-ID of the email, without < > brackets; if not present, a new UUID is
         generated
     """
-    return next(iter(msg.headers.get("message-id", ())), str(uuid.uuid4())).strip("<>")
+    # Only generate a UUID if needed, a default argument to next() would be evaluated every time
+    message_ids: tuple[str, ...] = msg.headers.get("message-id", ())
+    return (message_ids[0] if message_ids else str(uuid.uuid4())).strip("<>")
 
 
-def create_log_entry(
+def create_log_entry(  # noqa: PLR0913
     level: str,
     event: str,
     message: str,
     details: dict | None = None,
     list_id: str | None = None,
+    commit: bool = True,
 ) -> Logs:
     """
     Create and persist a log entry in the database.
@@ -862,6 +1091,8 @@ def create_log_entry(
         message (str): Log message text
         details (dict | None): Optional JSON-serializable details dictionary
         list_id (str | None): Optional mailing list ID this log relates to
+        commit (bool): Whether to commit right away. If False, the entry is only added to the
+            session and persisted with the caller's next commit
 
     Returns:
         Logs: The created and persisted log entry
@@ -876,18 +1107,28 @@ def create_log_entry(
     )
 
     db.session.add(log_entry)
-    db.session.commit()
+    if commit:
+        db.session.commit()
 
     return log_entry
 
 
-def get_log_entries(exact: bool = False, days: int = 0, **kwargs: str) -> list[Logs]:
+def get_log_entries(
+    exact: bool = False,
+    days: int = 0,
+    limit: int = 0,
+    fields: tuple[str, ...] = (),
+    **kwargs: str,
+) -> list[Logs]:
     """
     Retrieve log entries from the database based on provided filters.
 
     Args:
         exact (bool): If True, use exact matching; if False, use partial matching
         days (int): Only return log entries from the last given number of days. If 0, return all
+        limit (int): Only return the given number of newest log entries. If 0, return all
+        fields (tuple[str, ...]): Only load these columns, e.g. to skip the possibly large details.
+            Other columns are loaded on access. If empty, load all columns
         **kwargs: Filter criteria for querying logs (e.g., level='error', list_id=1)
 
     Returns:
@@ -905,11 +1146,15 @@ def get_log_entries(exact: bool = False, days: int = 0, **kwargs: str) -> list[L
         else:
             logging.warning("Invalid filter key for get_log_entries: %s", key)
 
-    log_entries: list[Logs] = query.order_by(Logs.timestamp.desc()).all()
     if days > 0:
         cutoff_date = datetime.now(tz=timezone.utc).replace(tzinfo=None) - timedelta(days=days)
-        log_entries = [log for log in log_entries if log.timestamp >= cutoff_date]
-    return log_entries
+        query = query.filter(Logs.timestamp >= cutoff_date)
+    if fields:
+        query = query.options(load_only(*(getattr(Logs, field) for field in fields)))
+    query = query.order_by(Logs.timestamp.desc())
+    if limit > 0:
+        query = query.limit(limit)
+    return query.all()
 
 
 def validate_email(email: str, allow_smtputf8: bool = True) -> bool:
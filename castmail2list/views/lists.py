@@ -9,6 +9,7 @@ import logging
 from flask import Blueprint, current_app, flash, redirect, render_template, request, url_for
 from flask_babel import _
 from flask_login import login_required
+from sqlalchemy.orm import raiseload
 from werkzeug.wrappers import Response
 
 from castmail2list.config import AppConfig
@@ -49,7 +50,10 @@ def before_request() -> None:
 def index() -> str:
     """Show all active mailing lists."""
     active_lists: list[MailingList] = (
-        MailingList.query.order_by(MailingList.id).filter_by(deleted=False).all()
+        MailingList.query.options(raiseload("*"))
+        .order_by(MailingList.id)
+        .filter_by(deleted=False)
+        .all()
     )
     return render_template("lists/index.html", lists=active_lists, config=AppConfig)
 
@@ -58,7 +62,10 @@ def index() -> str:
 def deactivated() -> str:
     """Show all deactivated mailing lists."""
     deactivated_lists: list[MailingList] = (
-        MailingList.query.order_by(MailingList.id).filter_by(deleted=True).all()
+        MailingList.query.options(raiseload("*"))
+        .order_by(MailingList.id)
+        .filter_by(deleted=True)
+        .all()
     )
     return render_template("lists/deactivated.html", lists=deactivated_lists, config=AppConfig)
 
@@ -93,7 +100,7 @@ def add() -> str | Response:
             imap_pass=form.imap_pass.data or current_app.config["IMAP_DEFAULT_PASS"],
         )
         # Verify that the list address is unique by checking the DB for the ID
-        existing_list = MailingList.query.filter_by(id=new_list.id).first()
+        existing_list = db.session.get(MailingList, new_list.id)
         if existing_list:
             status = "deactivated" if existing_list.deleted else "active"
             flash(
@@ -173,14 +180,14 @@ def add() -> str | Response:
 @lists.route("/<list_id>/edit", methods=["GET", "POST"])
 def edit(list_id: str) -> str | Response:  # noqa: C901
     """Edit a mailing list."""
-    mailing_list: MailingList = MailingList.query.filter_by(id=list_id).first_or_404()
+    mailing_list: MailingList = db.get_or_404(MailingList, list_id)
     form = MailingListForm(obj=mailing_list)
 
     # Handle form submission
     if form.validate_on_submit():
         # Verify that the list address is unique
         new_id = form.id.data.strip().lower()
-        existing_list: MailingList | None = MailingList.query.filter_by(id=new_id).first()
+        existing_list: MailingList | None = db.session.get(MailingList, new_id)
         if existing_list is not None and existing_list.id != mailing_list.id:
             status = _("deactivated") if existing_list.deleted else _("active")
             flash(
@@ -334,7 +341,7 @@ def reactivate(list_id: str) -> str | Response:
 @lists.route("/<list_id>/subscribers", methods=["GET", "POST"])
 def subscribers_manage(list_id: str) -> str | Response:
     """Manage subscribers of a mailing list."""
-    mailing_list: MailingList = MailingList.query.filter_by(id=list_id).first_or_404()
+    mailing_list: MailingList = db.get_or_404(MailingList, list_id)
     form = SubscriberAddForm()
 
     # Handle adding subscribers
@@ -413,7 +420,7 @@ def subscriber_delete(list_id: str, subscriber_email: str) -> str | Response:
 @lists.route("/<list_id>/subscribers/<subscriber_email>/edit", methods=["GET", "POST"])
 def subscriber_edit(list_id: str, subscriber_email: str) -> str | Response:
     """Edit a subscriber of a mailing list."""
-    mailing_list: MailingList = MailingList.query.filter_by(id=list_id).first_or_404()
+    mailing_list: MailingList = db.get_or_404(MailingList, list_id)
     subscriber: Subscriber = Subscriber.query.filter_by(
         list_id=list_id, email=subscriber_email
     ).first_or_404()
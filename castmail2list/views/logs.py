@@ -8,13 +8,13 @@ from flask import Blueprint, flash, render_template, request
 from flask_babel import _
 from flask_login import login_required
 
-from castmail2list.models import Logs, MailingList
+from castmail2list.models import Logs, MailingList, db
 from castmail2list.utils import get_log_entries
 
 logs = Blueprint("logs", __name__, url_prefix="/logs")
 
 # Columns allowed in log search to prevent probing of arbitrary DB columns
-LOG_SEARCH_FIELDS = {"level", "event", "message", "list_id"}
+LOG_SEARCH_FIELDS = frozenset({"level", "event", "message", "list_id"})
 
 
 @logs.before_request
@@ -57,8 +57,11 @@ def index() -> str:
 @logs.route("/<int:log_id>")
 def detail(log_id: int) -> str:
     """Show detail for a specific log entry."""
-    log_entry: Logs | None = Logs.query.get(log_id)
-    lists: dict[int, MailingList] = {ml.id: ml for ml in MailingList.query.all()}
+    log_entry: Logs | None = db.session.get(Logs, log_id)
+    # Only the list of this log entry is shown, so do not load all lists
+    lists: dict[str, MailingList] = {}
     if log_entry is None:
         flash(_("Log entry not found."), "error")
+    elif log_entry.list_id and (ml := db.session.get(MailingList, log_entry.list_id)):
+        lists[ml.id] = ml
     return render_template("logs/detail.html", log=log_entry, lists=lists)
@@ -28,7 +28,7 @@ def before_request() -> None:
 @messages.route("/")
 def index() -> str:
     """Show all normal incoming messages."""
-    msgs: list[EmailIn] = get_all_incoming_messages(only="ok")
+    msgs: list[EmailIn] = get_all_incoming_messages(only="ok", load_list=True)
     return render_template("messages/index.html", messages=msgs)
 
 
@@ -36,7 +36,7 @@ def index() -> str:
 def bounces() -> str:
     """Show only bounced messages."""
     return render_template(
-        "messages/bounces.html", messages=get_all_incoming_messages(only="bounces")
+        "messages/bounces.html", messages=get_all_incoming_messages(only="bounces", load_list=True)
     )
 
 
@@ -44,20 +44,23 @@ def bounces() -> str:
 def failures() -> str:
     """Show only failure messages (except bounces)."""
     return render_template(
-        "messages/failures.html", messages=get_all_incoming_messages(only="failures")
+        "messages/failures.html",
+        messages=get_all_incoming_messages(only="failures", load_list=True),
     )
 
 
 @messages.route("/sent")
 def sent() -> str:
     """Show all outgoing messages."""
-    return render_template("messages/sent.html", messages=get_all_outgoing_messages())
+    return render_template("messages/sent.html", messages=get_all_outgoing_messages(load_list=True))
 
 
 @messages.route("/<message_id>")
 def show(message_id: str) -> str:
     """Show a specific message, without list context."""
-    msgs: list[EmailIn | EmailOut] = get_message_id_in_db([message_id])
+    msgs: list[EmailIn | EmailOut] = get_message_id_in_db(
+        [message_id], load_raw=True, load_list=True
+    )
 
     if len(msgs) == 1:
         msg = msgs[0]
@@ -82,24 +85,29 @@ def show(message_id: str) -> str:
 @messages.route("<message_id>/<list_id>")
 def show_unique(message_id: str, list_id: str) -> str:
     """Show a specific message, with list context."""
-    msgs: list[EmailIn | EmailOut] = get_message_id_in_db([message_id])
+    msgs: list[EmailIn | EmailOut] = get_message_id_in_db(
+        [message_id], load_raw=True, load_list=True
+    )
 
-    msg_unique: EmailIn | EmailOut
+    msg_unique: EmailIn | EmailOut | None = None
     if len(msgs) > 1:
-        msg_unique = get_message_id_in_db([message_id], list_id=list_id)[0]
-        flash(
-            Markup(  # noqa: S704 — hardcoded template with safe url_for() link, not user input
-                _(
-                    "Multiple messages found with the same Message-ID. Showing message for the "
-                    "selected list. See <a href='%(link)s'>here</a> for the other messages.",
-                    link=url_for("messages.show", message_id=message_id),
-                )
-            ),
-            "message",
-        )
+        # The messages are already loaded, pick the one of the selected list from them
+        msg_unique = next((msg for msg in msgs if msg.list_id == list_id), None)
+        if msg_unique is not None:
+            flash(
+                Markup(  # noqa: S704 — hardcoded template with safe url_for() link, not user input
+                    _(
+                        "Multiple messages found with the same Message-ID. Showing message for the "
+                        "selected list. See <a href='%(link)s'>here</a> for the other messages.",
+                        link=url_for("messages.show", message_id=message_id),
+                    )
+                ),
+                "message",
+            )
     elif len(msgs) == 1:
         msg_unique = msgs[0]
-    else:
+
+    if msg_unique is None:
         # Message not found
         flash(_("Message not found"), "error")
         return render_template("messages/detail.html", message=None)
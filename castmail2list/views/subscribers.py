@@ -7,6 +7,7 @@
 from flask import Blueprint, flash, render_template
 from flask_babel import _
 from flask_login import login_required
+from sqlalchemy import select
 
 from castmail2list.models import MailingList, Subscriber, db
 from castmail2list.utils import get_all_subscribers, is_email_a_list
@@ -29,22 +30,24 @@ def index() -> str:
 @subscribers.route("/<email>")
 def by_email(email: str) -> str | tuple[str, int]:
     """Show which lists a subscriber is part of."""
-    # Find all subscriptions for this email address
     email_norm = email.strip().lower()
-    subscriptions: list[Subscriber] = (
-        Subscriber.query.order_by(Subscriber.email).filter_by(email=email_norm).all()
-    )
+    # Find all subscriptions for this email address, together with their lists in one query
+    subscriptions = db.session.execute(
+        select(Subscriber, MailingList)
+        .outerjoin(MailingList, Subscriber.list_id == MailingList.id)
+        .where(Subscriber.email == email_norm)
+        .order_by(Subscriber.email)
+    ).all()
 
     if not subscriptions:
         flash(_('No subscriptions found for "%(email)s"', email=email), "warning")
         return render_template("subscribers/by_email.html", email=email), 404
 
-    # Get list information for each subscription
-    subscriber_lists = []
-    for sub in subscriptions:
-        mailing_list: MailingList | None = db.session.get(MailingList, sub.list_id)
-        if mailing_list:
-            subscriber_lists.append({"list": mailing_list, "subscriber": sub})
+    subscriber_lists = [
+        {"list": mailing_list, "subscriber": sub}
+        for sub, mailing_list in subscriptions
+        if mailing_list is not None
+    ]
 
     # Flash if subscriber is itself a list
     if is_email_a_list(email):
@@ -20,6 +20,7 @@ from werkzeug.security import generate_password_hash
 
 from castmail2list.app import create_app
 from castmail2list.imap_worker import IncomingEmail
+from castmail2list.mailer import _idle_smtp_sessions
 from castmail2list.models import MailingList, Subscriber, User, db
 
 
@@ -40,16 +41,19 @@ def fixture_app():
 
 
 @pytest.fixture(name="client")
-def fixture_client():
+def fixture_client(request: pytest.FixtureRequest):
     """Create a test client with an authenticated user and initial data.
 
-    Sets up an in-memory SQLite database and seeds a user and a mailing list.
+    Sets up an in-memory SQLite database and seeds a user and a mailing list. Further config
+    values can be passed via indirect parametrization, e.g.
+    `@pytest.mark.parametrize("client", [{"SMTP_MAX_CONNECTIONS": 1}], indirect=True)`.
     """
     app = create_app(
         config_overrides={
             "TESTING": True,
             "SECRET_KEY": "test",
             "SQLALCHEMY_DATABASE_URI": "sqlite:///:memory:",
+            **getattr(request, "param", {}),
         },
         one_off_call=True,
     )
@@ -419,5 +423,18 @@ def fixture_smtp_mock(monkeypatch: MonkeyPatch):
                 {"from_addr": from_addr, "to_addrs": to_addrs, "msg": msg, "msg_parsed": msg}
             )
 
+        def quit(self) -> None:
+            """Mock quit."""
+
+        def close(self) -> None:
+            """Mock close."""
+
+        def noop(self) -> tuple[int, bytes]:
+            """Mock noop."""
+            return (250, b"OK")
+
     monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP", MockSMTP)
-    return smtp_calls
+    # Idle sessions of previous tests would bypass this test's mock
+    _idle_smtp_sessions.close_all()
+    yield smtp_calls
+    _idle_smtp_sessions.close_all()
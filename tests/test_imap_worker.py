@@ -172,6 +172,23 @@ def test_sender_authentication_and_to_cleanup(mailing_list: MailingList, incomin
     assert passed is True
 
 
+def test_remove_suffixes_in_to_addresses(incoming_message_factory):
+    """The +suffix is removed from list addresses in To, but kept for other addresses."""
+    raw = (
+        b"Subject: Suffix Test\nTo: List+secret123@Example.com, user+tag@example.com\n"
+        b"From: auth@example.com\n\nBody"
+    )
+    msg = MailMessage.from_bytes(raw)
+    msg.uid = "suffix-1"
+    incoming: IncomingEmail = incoming_message_factory(msg)
+
+    incoming._remove_suffixes_in_to_addresses()
+
+    expected = ("List@Example.com", "user+tag@example.com")
+    assert incoming.msg.to == expected
+    assert tuple(to_value.email for to_value in incoming.msg.to_values) == expected
+
+
 def test_duplicate_detection_same_list(incoming_message_factory, mailbox_stub: MailboxStub):
     """Processing the same Message-ID for the same list twice should move the second copy to
     duplicate folder.
@@ -776,6 +793,45 @@ def test_check_all_lists_handles_imap_errors(monkeypatch, client):
     imap_worker_mod.check_all_lists_for_messages(client.application)
 
 
+def test_check_all_lists_resolves_recipients_once_per_list(monkeypatch, client):
+    """check_all_lists_for_messages should resolve the recipients of a list once per run."""
+    stub = MailboxStub()
+    msgs = []
+    for i in range(3):
+        msg = MailMessage.from_bytes(
+            f"Subject: Test {i}\nTo: list@example.com\nFrom: sender@example.com\n\nBody".encode()
+        )
+        msg.uid = f"uid-{i}"
+        msgs.append(msg)
+    stub.fetch = lambda mark_seen=False: iter(msgs)  # type: ignore[attr-defined]
+    monkeypatch.setattr(imap_worker_mod, "MailBox", make_mailbox_context(stub))
+    monkeypatch.setattr(IncomingEmail, "process_incoming_msg", lambda self: True)
+
+    resolved = []
+    original_resolve = imap_worker_mod.get_list_recipients_recursive
+
+    def _resolve(list_id, **kwargs):
+        resolved.append(list_id)
+        return original_resolve(list_id, **kwargs)
+
+    sent = []
+
+    def _send(app, msg, ml, mailbox, recipients=None):
+        del app, mailbox
+        sent.append((ml.id, msg.uid, recipients))
+        return [], []
+
+    monkeypatch.setattr(imap_worker_mod, "get_list_recipients_recursive", _resolve)
+    monkeypatch.setattr(imap_worker_mod, "send_msg_to_subscribers", _send)
+
+    imap_worker_mod.check_all_lists_for_messages(client.application)
+
+    list_ids = [ml.id for ml in MailingList.query.filter_by(deleted=False).all()]
+    assert sorted(resolved) == sorted(list_ids)
+    assert len(sent) == 3 * len(list_ids)
+    assert all(recipients is not None for _, _, recipients in sent)
+
+
 def test_validate_sender_auth_when_from_missing(
     mailing_list: MailingList, incoming_message_factory
 ):
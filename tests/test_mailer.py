@@ -10,18 +10,28 @@ produce correct email headers and behavior as documented in doc/modes_and_header
 """
 
 import email
+import smtplib
 from unittest.mock import MagicMock
 
+import pytest
 from imap_tools import MailMessage
+from sqlalchemy import insert
+from typing_extensions import Self
 
+from castmail2list import mailer
 from castmail2list.mailer import (
+    IdleSmtpSessions,
     OutgoingEmail,
+    SmtpConfig,
+    SmtpPool,
+    SmtpSession,
     _rejection_notification_timestamps,
+    send_email_via_smtp,
     send_msg_to_subscribers,
     send_rejection_notification,
     should_notify_sender,
 )
-from castmail2list.models import MailingList, Subscriber, db
+from castmail2list.models import EmailOut, Logs, MailingList, Subscriber, db
 
 
 def create_test_message(
@@ -208,13 +218,12 @@ def test_broadcast_recipient_appended_to_to(
     # Send to recipient
     result = mail.send_email_to_recipient("newrecipient@example.com")
 
-    # Verify recipient was added to msg.to
-    assert "newrecipient@example.com" in mail.msg.to
-    assert "newrecipient@example.com" in result.decode()
+    # Verify recipient was added to the To header
+    to_header = email.message_from_bytes(result)["To"]
+    assert "newrecipient@example.com" in to_header
 
     # Original other recipient should still be present
-    assert "other@example.net" in mail.msg.to
-    assert "other@example.net" in result.decode()
+    assert "other@example.net" in to_header
 
 
 # ==================== Tests for Group Mode ====================
@@ -394,6 +403,52 @@ def test_threading_headers(client, broadcast_list: MailingList):
     assert "<reply@example.com>" in refs
 
 
+def test_threading_headers_folded_references(client, broadcast_list: MailingList):
+    """Test that References folded over several lines are joined into a single line."""
+    raw = (
+        b"From: sender@example.com\n"
+        b"To: broadcast@example.com\n"
+        b"Subject: Re: Thread\n"
+        b"Message-ID: <reply@example.com>\n"
+        b"References: <first@example.com>\n"
+        b"\t<second@example.com>\n"
+        b"\n"
+        b"Reply body"
+    )
+    msg = MailMessage.from_bytes(raw)
+    msg.uid = "reply"
+
+    mail = OutgoingEmail(
+        app=client.application,
+        ml=broadcast_list,
+        msg=msg,
+        message_id="<new-msg-id@example.com>",
+    )
+
+    assert mail.composed_msg is not None
+    assert mail.composed_msg["References"] == (
+        "<first@example.com> <second@example.com> <reply@example.com>"
+    )
+
+
+def test_threading_headers_without_message_id(client, broadcast_list: MailingList):
+    """Test that no empty threading headers are added if the original has no Message-ID."""
+    raw = b"From: sender@example.com\nTo: broadcast@example.com\nSubject: No ID\n\nBody"
+    msg = MailMessage.from_bytes(raw)
+    msg.uid = "no-id"
+
+    mail = OutgoingEmail(
+        app=client.application,
+        ml=broadcast_list,
+        msg=msg,
+        message_id="<new-msg-id@example.com>",
+    )
+
+    assert mail.composed_msg is not None
+    for header in ("Original-Message-ID", "In-Reply-To", "References"):
+        assert header not in mail.composed_msg
+
+
 def test_cc_header_preserved(client, broadcast_list: MailingList):
     """Test that Cc header is preserved in outgoing message."""
     msg = create_test_message(cc_addrs=("cc1@example.com", "cc2@example.com"))
@@ -422,10 +477,35 @@ def test_x_recipient_header(client, broadcast_list: MailingList, smtp_mock):
         message_id="<new-msg-id@example.com>",
     )
 
-    mail.send_email_to_recipient(recipient=recipient)
+    result = mail.send_email_to_recipient(recipient=recipient)
+
+    # Check X-Recipient was set, exactly once
+    assert email.message_from_bytes(result).get_all("X-Recipient") == [recipient]
+    assert email.message_from_bytes(smtp_mock[0]["msg"])["X-Recipient"] == recipient
+
+
+def test_per_recipient_headers_keep_body(client, broadcast_list: MailingList, smtp_mock):
+    """Test that the common part is serialized once and only the recipient headers differ."""
+    msg = create_test_message(body_text="Grüße aus Köln")
+
+    mail = OutgoingEmail(
+        app=client.application,
+        ml=broadcast_list,
+        msg=msg,
+        message_id="<new-msg-id@example.com>",
+    )
+
+    first = email.message_from_bytes(mail.send_email_to_recipient("one@example.com"))
+    second = email.message_from_bytes(mail.send_email_to_recipient("two@example.com"))
 
-    # Check X-Recipient was set
-    assert mail.composed_msg["X-Recipient"] == recipient
+    assert first["To"] == "one@example.com"
+    assert second["To"] == "two@example.com"
+    assert second.get_all("To") == ["two@example.com"]
+    assert first.get_payload(decode=True) == second.get_payload(decode=True)
+    assert "Grüße aus Köln" in second.get_payload(decode=True).decode()
+    # The shared message itself is left without per-recipient headers
+    assert mail.composed_msg is not None
+    assert mail.composed_msg["To"] is None
 
 
 def test_envelope_from_is_bounce_address(client, broadcast_list: MailingList, smtp_mock):
@@ -449,6 +529,53 @@ def test_envelope_from_is_bounce_address(client, broadcast_list: MailingList, sm
     assert "recipient=example.com" in envelope_from
 
 
+def test_implicit_tls_on_port_465(monkeypatch, smtp_mock):
+    """Test that port 465 uses SMTP_SSL without STARTTLS, and other ports use plain SMTP."""
+    ssl_connections = []
+
+    class MockSMTPSSL:
+        """Mock SMTP_SSL class that records connections and fails on STARTTLS."""
+
+        def __init__(self, host, port, local_hostname=None, context=None) -> None:
+            ssl_connections.append({"host": host, "port": port, "context": context})
+
+        def __enter__(self) -> Self:
+            return self
+
+        def __exit__(self, *args) -> None:
+            pass
+
+        def starttls(self) -> None:
+            """STARTTLS must not be issued on an implicit TLS connection."""
+            raise AssertionError
+
+        def login(self, user, password) -> None:
+            """Mock login."""
+
+        def sendmail(self, from_addr, to_addrs, msg) -> None:
+            """Mock sendmail."""
+
+    monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP_SSL", MockSMTPSSL)
+
+    kwargs = {
+        "smtp_host": "smtp.example.com",
+        "smtp_user": "user",
+        "smtp_password": "pass",
+        "smtp_starttls": True,
+        "message": b"Subject: test\r\n\r\nbody",
+        "from_addr": "list@example.com",
+        "to_addrs": "recipient@example.com",
+    }
+    send_email_via_smtp(smtp_port=465, **kwargs)
+    assert len(ssl_connections) == 1
+    assert ssl_connections[0]["context"] is not None
+    assert len(smtp_mock) == 0
+
+    send_email_via_smtp(smtp_port=587, **kwargs)
+    assert len(ssl_connections) == 1
+    assert len(smtp_mock) == 1
+
+
 # ==================== Tests for Message Body and Attachments ====================
 
 
@@ -481,9 +608,10 @@ def test_multipart_alternative_text_and_html(client, broadcast_list: MailingList
         message_id="<new-msg-id@example.com>",
     )
 
-    # Should use MIMEMultipart
+    # Should be multipart/alternative
     assert mail.composed_msg is not None
     assert mail.composed_msg.is_multipart()
+    assert mail.composed_msg.get_content_type() == "multipart/alternative"
 
 
 def test_simple_text_message(client, broadcast_list: MailingList):
@@ -554,12 +682,65 @@ def test_attachment_non_ascii_filename_is_encoded(client, broadcast_list: Mailin
     parsed = _email.message_from_bytes(serialised)
     filenames = [part.get_filename() for part in parsed.walk() if part.get_filename()]
     assert filenames, "No filename found in any part of the outgoing message"
+    # The payload survives the base64 transfer encoding unchanged
+    attachment = next(part for part in parsed.walk() if part.get_filename())
+    assert attachment["Content-Transfer-Encoding"] == "base64"
+    assert attachment.get_payload(decode=True) == b"%PDF-"
     # The decoded filename must be present and correct (with the non-ASCII ü)
     assert any(
         "einladung" in (fn or "").lower() and "hlingsfest" in (fn or "").lower() for fn in filenames
     ), f"Expected decoded filename not found; got: {filenames}"
 
 
+def test_attachment_malformed_content_type(client, broadcast_list: MailingList, monkeypatch):
+    """Test that an attachment with a content type lacking a subtype is sent as octet-stream."""
+    msg = create_test_message()
+    attachment = MagicMock(
+        content_type="pdf",
+        payload=b"%PDF-",
+        content_disposition="attachment",
+        filename="file.pdf",
+    )
+    monkeypatch.setattr(MailMessage, "attachments", property(lambda _self: [attachment]))
+
+    mail = OutgoingEmail(
+        app=client.application,
+        ml=broadcast_list,
+        msg=msg,
+        message_id="<new-msg-id@example.com>",
+    )
+
+    assert mail.composed_msg is not None
+    parts = [part for part in mail.composed_msg.walk() if part.get_filename() == "file.pdf"]
+    assert len(parts) == 1
+    assert parts[0].get_content_type() == "application/octet-stream"
+
+
+def test_non_ascii_body_is_7bit_clean(client, broadcast_list: MailingList):
+    """Test that non-ASCII bodies are transfer-encoded and an unparsable Date is replaced."""
+    msg = create_test_message(body_text="Grüße aus Köln")
+    msg.obj.replace_header("Date", "not a date")
+
+    mail = OutgoingEmail(
+        app=client.application,
+        ml=broadcast_list,
+        msg=msg,
+        message_id="new-msg-id@example.com",
+    )
+
+    assert mail.composed_msg is not None
+    serialised: bytes = mail.composed_msg.as_bytes()
+    # Must be pure ASCII on the wire, with CRLF line endings
+    serialised.decode("ascii")
+    assert b"\r\n" in serialised
+
+    parsed = email.message_from_bytes(serialised)
+    assert parsed["Date"]
+    assert parsed["Date"] != "not a date"
+    body = parsed.get_payload(decode=True)
+    assert "Grüße aus Köln" in body.decode("utf-8")
+
+
 # ==================== Tests for send_msg_to_subscribers Integration ====================
 
 
@@ -592,10 +773,402 @@ def test_send_msg_to_subscribers_success(
     assert len(smtp_mock) == 2
 
 
-def test_send_msg_deepcopy_prevents_cross_contamination(
+def test_send_msg_to_subscribers_resolves_recipients_once(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock, monkeypatch
+):
+    """Test that the recipients of the list are only looked up once per message."""
+    msg = create_test_message()
+    db.session.add(Subscriber(list_id=broadcast_list.id, email="sub1@example.com"))
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+    lookup = MagicMock(wraps=mailer.get_list_recipients_recursive)
+    monkeypatch.setattr(mailer, "get_list_recipients_recursive", lookup)
+
+    sent_successful, _ = send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    assert sent_successful == ["sub1@example.com"]
+    assert lookup.call_count == 1
+
+
+def test_send_msg_to_subscribers_stores_raw_message(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock
+):
+    """Test that the stored outgoing message is the common part without recipient headers."""
+    msg = create_test_message(subject="Stored subject")
+    db.session.add(Subscriber(list_id=broadcast_list.id, email="sub1@example.com"))
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+
+    send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    email_out = EmailOut.query.filter_by(list_id=broadcast_list.id).one()
+    stored = email.message_from_string(email_out.raw)
+    assert stored["Subject"] == "Stored subject"
+    assert stored["X-Recipient"] is None
+    # The sent message is the stored one plus the recipient headers
+    assert smtp_mock[0]["msg"].endswith(email_out.raw.encode())
+
+
+def test_send_msg_to_subscribers_dedupes_recipients(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock
+):
+    """Test that recipients differing only in case get one email, and invalid ones none."""
+    msg = create_test_message()
+    db.session.add(Subscriber(list_id=broadcast_list.id, email="sub1@example.com"))
+    # Bypass the model's validation, like rows from older versions or manual database edits
+    db.session.execute(
+        insert(Subscriber),
+        [
+            {"list_id": broadcast_list.id, "email": "Sub1@Example.com", "bounces": 0},
+            {"list_id": broadcast_list.id, "email": "broken@", "bounces": 0},
+        ],
+    )
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+
+    sent_successful, sent_failed = send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    assert sent_successful == ["sub1@example.com"]
+    assert sent_failed == []
+    assert [call["to_addrs"] for call in smtp_mock] == ["sub1@example.com"]
+
+
+# Only with one connection the SMTP calls happen in a predictable order
+@pytest.mark.parametrize("client", [{"SMTP_MAX_CONNECTIONS": 1}], indirect=True)
+def test_send_msg_to_subscribers_grouped_by_domain(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock
+):
+    """Test that recipients are sent to grouped by their domain."""
+    msg = create_test_message()
+
+    for addr in ("a@zeta.example", "b@alpha.example", "c@zeta.example", "a@alpha.example"):
+        db.session.add(Subscriber(list_id=broadcast_list.id, email=addr))
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+
+    send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    assert [call["to_addrs"] for call in smtp_mock] == [
+        "a@alpha.example",
+        "b@alpha.example",
+        "a@zeta.example",
+        "c@zeta.example",
+    ]
+
+
+@pytest.mark.parametrize("client", [{"SMTP_MAX_CONNECTIONS": 1}], indirect=True)
+def test_send_msg_to_subscribers_reuses_smtp_connection(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock, monkeypatch
+):
+    """Test that one SMTP connection is opened for all subscribers of a message."""
+    msg = create_test_message()
+
+    for i in range(3):
+        db.session.add(Subscriber(list_id=broadcast_list.id, email=f"sub{i}@example.com"))
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+    connect = MagicMock(wraps=smtplib.SMTP)
+    monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP", connect)
+
+    send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    assert len(smtp_mock) == 3
+    assert connect.call_count == 1
+
+
+@pytest.mark.parametrize("client", [{"SMTP_MAX_CONNECTIONS": 3}], indirect=True)
+def test_send_msg_to_subscribers_parallel_connections(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock, monkeypatch
+):
+    """Test that sending uses at most SMTP_MAX_CONNECTIONS connections and keeps the order."""
+    msg = create_test_message()
+
+    subscribers = [f"sub{i}@example.com" for i in range(10)]
+    for addr in subscribers:
+        db.session.add(Subscriber(list_id=broadcast_list.id, email=addr))
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+    connect = MagicMock(wraps=smtplib.SMTP)
+    monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP", connect)
+
+    sent_successful, sent_failed = send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    assert sent_successful == subscribers
+    assert sent_failed == []
+    assert sorted(call["to_addrs"] for call in smtp_mock) == subscribers
+    assert 1 <= connect.call_count <= 3
+    # Sent messages are stored in the order of the recipients
+    stored = [
+        email.message_from_bytes(call.kwargs["message"])["X-Recipient"]
+        for call in mailbox_stub.append.call_args_list
+    ]
+    assert stored == subscribers
+
+
+def test_smtp_pool_reuses_connected_session(monkeypatch, smtp_mock):
+    """Test that SmtpPool only opens further connections if emails are sent in parallel."""
+    connect = MagicMock(wraps=smtplib.SMTP)
+    monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP", connect)
+    config = SmtpConfig(
+        domain="example.com",
+        host="smtp.example.com",
+        port=587,
+        user="user",
+        password="pass",
+        starttls=True,
+        max_connections=4,
+    )
+
+    def send(recipient: str, smtp: SmtpSession) -> None:
+        smtp.sendmail("list@example.com", recipient, b"Subject: test")
+
+    with SmtpPool(config) as smtp_pool:
+        for i in range(3):
+            smtp_pool.submit(send, f"sub{i}@example.com").result()
+
+    assert len(smtp_mock) == 3
+    assert connect.call_count == 1
+
+
+def test_smtp_session_reconnects_after_disconnect(monkeypatch, smtp_mock):
+    """Test that SmtpSession reconnects once when the server has closed the connection."""
+    connections = []
+    mock_smtp = smtplib.SMTP
+
+    class DroppingSMTP(mock_smtp):
+        """Mock SMTP whose first connection is dropped after the first email."""
+
+        def __init__(self, *args, **kwargs) -> None:
+            super().__init__(*args, **kwargs)
+            self.sent = 0
+            connections.append(self)
+
+        def sendmail(self, from_addr, to_addrs, msg) -> None:
+            if len(connections) == 1 and self.sent == 1:
+                raise smtplib.SMTPServerDisconnected
+            self.sent += 1
+            super().sendmail(from_addr, to_addrs, msg)
+
+    monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP", DroppingSMTP)
+
+    config = SmtpConfig(
+        domain="example.com",
+        host="smtp.example.com",
+        port=587,
+        user="user",
+        password="pass",
+        starttls=True,
+        max_connections=1,
+    )
+    with SmtpSession(config) as session:
+        assert not connections  # Not connected before the first email
+        for i in range(3):
+            session.sendmail("list@example.com", f"sub{i}@example.com", b"Subject: test")
+
+    assert len(connections) == 2
+    assert [call["to_addrs"] for call in smtp_mock] == [
+        "sub0@example.com",
+        "sub1@example.com",
+        "sub2@example.com",
+    ]
+
+
+@pytest.mark.parametrize("client", [{"SMTP_MAX_CONNECTIONS": 2}], indirect=True)
+def test_smtp_config_follows_app_config(client):
+    """Test that the SMTP settings are read from the current app config."""
+    app = client.application
+    assert mailer._smtp_config(app).max_connections == 2
+
+    app.config["SMTP_HOST"] = "smtp2.example.com"
+    assert mailer._smtp_config(app).host == "smtp2.example.com"
+
+
+def test_idle_smtp_sessions_reuse_and_check(monkeypatch, smtp_mock):
+    """Test that idle sessions are reused while alive and replaced when dropped or expired."""
+    connect = MagicMock(wraps=smtplib.SMTP)
+    monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP", connect)
+    config = SmtpConfig(
+        domain="example.com",
+        host="smtp.example.com",
+        port=587,
+        user="user",
+        password="pass",
+        starttls=True,
+        max_connections=1,
+    )
+    sessions = IdleSmtpSessions(timeout=60)
+
+    for i in range(2):
+        with sessions.session(config) as smtp:
+            smtp.sendmail("", f"sender{i}@example.com", b"Subject: test")
+    assert connect.call_count == 1
+
+    # The server has dropped the idle connection in the meantime
+    monkeypatch.setattr(smtp.server, "noop", MagicMock(side_effect=smtplib.SMTPServerDisconnected))
+    with sessions.session(config) as smtp:
+        smtp.sendmail("", "sender2@example.com", b"Subject: test")
+    assert connect.call_count == 2
+
+    # Sessions idle for too long are not reused
+    sessions.timeout = 0
+    with sessions.session(config) as smtp:
+        smtp.sendmail("", "sender3@example.com", b"Subject: test")
+    assert connect.call_count == 3
+    sessions.close_all()
+
+    assert len(smtp_mock) == 4
+
+
+def test_idle_smtp_sessions_close_expired_on_put_back(monkeypatch, smtp_mock):
+    """Test that expired idle sessions of any settings are closed when a session is put back."""
+    config = SmtpConfig(
+        domain="example.com",
+        host="smtp.example.com",
+        port=587,
+        user="user",
+        password="pass",
+        starttls=True,
+        max_connections=1,
+    )
+    other_config = config._replace(host="smtp2.example.com")
+    sessions = IdleSmtpSessions(timeout=60)
+    clock = MagicMock(return_value=1000.0)
+    monkeypatch.setattr("castmail2list.mailer.time.monotonic", clock)
+
+    with sessions.session(other_config) as old:
+        old.sendmail("", "sender0@example.com", b"Subject: test")
+    assert old.server is not None
+
+    clock.return_value = 1100.0
+    with sessions.session(config) as smtp:
+        smtp.sendmail("", "sender1@example.com", b"Subject: test")
+
+    # The session of the other settings has expired and is closed, the new one is kept
+    assert old.server is None
+    assert list(sessions.idle) == [(config, None)]
+    sessions.close_all()
+    assert smtp.server is None
+    assert len(smtp_mock) == 2
+
+
+def test_send_rejection_notifications_reuse_connection(client, smtp_mock, monkeypatch):
+    """Test that consecutive rejection notifications are sent over the same connection."""
+    client.application.config["NOTIFY_REJECTED_SENDERS"] = True
+    client.application.config["NOTIFY_REJECTED_KNOWN_ONLY"] = False
+    _rejection_notification_timestamps.clear()
+    connect = MagicMock(wraps=smtplib.SMTP)
+    monkeypatch.setattr("castmail2list.mailer.smtplib.SMTP", connect)
+
+    for i in range(3):
+        assert send_rejection_notification(
+            app=client.application,
+            sender_email=f"sender{i}@example.com",
+            recipient="list@example.com",
+            reason="Not a member",
+        )
+
+    assert [call["to_addrs"] for call in smtp_mock] == [f"sender{i}@example.com" for i in range(3)]
+    assert connect.call_count == 1
+
+
+def test_send_msg_to_subscribers_builds_mime_once(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock, monkeypatch
+):
+    """Test that the MIME structure is built and serialized once per message, not per recipient."""
+    msg = create_test_message(body_html="<p>HTML</p>")
+    for i in range(3):
+        db.session.add(Subscriber(list_id=broadcast_list.id, email=f"sub{i}@example.com"))
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+    calls = []
+
+    def counting(name, func):
+        def wrapper(*args, **kwargs):
+            calls.append(name)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        OutgoingEmail, "add_body_parts", counting("body", OutgoingEmail.add_body_parts)
+    )
+    monkeypatch.setattr(
+        email.message.EmailMessage,
+        "as_bytes",
+        counting("bytes", email.message.EmailMessage.as_bytes),
+    )
+
+    send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    assert len(smtp_mock) == 3
+    assert calls == ["body", "bytes"]
+
+
+def test_address_header_matches_folded_header():
+    """Test that the shortcut for single address headers gives the same result as folding."""
+    for address in (
+        "sub1@example.com",
+        "first.last+tag@sub.example.org",
+        "Sender Name <sender@example.com>",
+        "a@example.com, b@example.com",
+        "jürgen@example.com",
+        f"{'x' * 90}@example.com",
+    ):
+        assert mailer._address_header("To", address) == mailer._fold_header("To", address)
+
+
+def test_send_msg_to_subscribers_logs_failures_in_one_commit(
+    client, broadcast_list: MailingList, mailbox_stub, smtp_mock, monkeypatch
+):
+    """Test that failed recipients are logged, and committed together with the sent message."""
+    msg = create_test_message()
+    for i in range(3):
+        db.session.add(Subscriber(list_id=broadcast_list.id, email=f"sub{i}@example.com"))
+    db.session.commit()
+
+    mailbox_stub.append = MagicMock()
+    monkeypatch.setattr(
+        smtplib.SMTP, "sendmail", MagicMock(side_effect=smtplib.SMTPRecipientsRefused({}))
+    )
+    commit = MagicMock(wraps=db.session.commit)
+    monkeypatch.setattr(db.session, "commit", commit)
+
+    sent_successful, sent_failed = send_msg_to_subscribers(
+        app=client.application, msg=msg, ml=broadcast_list, mailbox=mailbox_stub
+    )
+
+    assert sent_successful == []
+    assert len(sent_failed) == 3
+    assert commit.call_count == 1
+    logs = Logs.query.filter_by(event="email_out", level="error").all()
+    assert sorted(log.details["recipient"] for log in logs) == sent_failed
+
+
+def test_send_msg_no_cross_contamination(
     client, broadcast_list: MailingList, mailbox_stub, smtp_mock
 ):
-    """Test that deepcopy prevents header cross-contamination between recipients."""
+    """Test that per-recipient headers do not leak between recipients of the shared message."""
     msg = create_test_message()
 
     # Add two subscribers
@@ -620,6 +1193,8 @@ def test_send_msg_deepcopy_prevents_cross_contamination(
         else:
             msg_parsed = email.message_from_string(msg_data)
         recipients_found.append(msg_parsed["X-Recipient"])
+        # Only the recipient itself is added to To, not the ones before it
+        assert msg_parsed["To"] == msg_parsed["X-Recipient"]
 
     # Each message should have correct X-Recipient
     assert len(recipients_found) == 2
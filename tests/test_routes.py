@@ -4,6 +4,8 @@
 
 """Tests for route responses in the Castmail2List application."""
 
+from castmail2list.models import EmailIn, EmailOut, Logs, MailingList, db
+
 from .conftest import add_subscriber
 
 
@@ -13,6 +15,15 @@ def test_main_route_status_code(client):
     assert response.status_code == 200
 
 
+def test_version_info_determined_once(client, monkeypatch):
+    """Test that the version info is not determined again on each request."""
+    calls = []
+    monkeypatch.setattr("castmail2list.app.get_version_info", lambda **kw: calls.append(kw))
+    assert client.get("/").status_code == 200
+    assert client.get("/").status_code == 200
+    assert not calls
+
+
 def test_subscriber_does_not_exist(client):
     """Test that the subscriber route returns a 404 status code if subscriber does not exist."""
     response = client.get("/subscriber/noexist@example.com")
@@ -26,6 +37,108 @@ def test_subscriber_exists(client):
     assert response.status_code == 200
 
 
+def test_subscriber_lists_shown(client):
+    """Test that the subscriber route shows all lists the address is subscribed to."""
+    add_subscriber(email="user@example.com", list_id="test")
+    response = client.get("/subscribers/User@Example.com")
+    assert response.status_code == 200
+    assert b"/lists/test/subscribers" in response.data
+
+
+def test_message_overviews_show_list(client):
+    """Test that the message overviews show the list of each message."""
+    for status in ("ok", "bounce-msg", "no-auth"):
+        db.session.add(
+            EmailIn(
+                message_id=f"in-{status}",
+                list_id="test",
+                from_addr="sender@example.com",
+                headers="{}",
+                status=status,
+            )
+        )
+    db.session.add(EmailOut(message_id="out", email_in_mid="in-ok", list_id="test"))
+    db.session.commit()
+
+    for url in ("/messages/", "/messages/bounces", "/messages/failures", "/messages/sent"):
+        response = client.get(url)
+        assert response.status_code == 200, url
+        assert b"Test List" in response.data, url
+
+
+def test_message_detail_shows_raw(client):
+    """Test that the message detail pages show the raw message."""
+    db.session.add(
+        EmailIn(
+            message_id="in-raw",
+            list_id="test",
+            from_addr="sender@example.com",
+            headers="{}",
+            raw="Subject: Raw message text",
+            status="ok",
+        )
+    )
+    db.session.commit()
+    db.session.expunge_all()
+
+    for url in ("/messages/in-raw", "/messages/in-raw/test"):
+        response = client.get(url)
+        assert response.status_code == 200, url
+        assert b"Subject: Raw message text" in response.data, url
+
+
+def test_message_detail_multiple_lists(client):
+    """Test that a message received by several lists is shown with the selected list."""
+    db.session.add(
+        MailingList(
+            id="other",
+            display="Other List",
+            address="other@example.com",
+            mode="broadcast",
+            imap_host="ml.local",
+            imap_port=993,
+            imap_user="user",
+            imap_pass="pass",
+        )
+    )
+    for list_id in ("test", "other"):
+        db.session.add(
+            EmailIn(
+                message_id="in-dup",
+                list_id=list_id,
+                from_addr="sender@example.com",
+                headers="{}",
+                raw=list_id,
+            )
+        )
+    db.session.commit()
+
+    response = client.get("/messages/in-dup")
+    assert response.status_code == 200
+    assert b"Test List" in response.data
+    assert b"Other List" in response.data
+
+    response = client.get("/messages/in-dup/other")
+    assert response.status_code == 200
+    assert b"other@example.com" in response.data
+
+    response = client.get("/messages/in-dup/missing")
+    assert response.status_code == 200
+    assert b"Message not found" in response.data
+
+
+def test_log_detail_shows_list(client):
+    """Test that the log detail page shows the list of the entry."""
+    log = Logs(level="info", event="test", message="Log with list", list_id="test")
+    db.session.add(log)
+    db.session.commit()
+
+    response = client.get(f"/logs/{log.id}")
+    assert response.status_code == 200
+    assert b"Log with list" in response.data
+    assert b"Test List" in response.data
+
+
 def test_template_lists_unauthed(client_unauthed):
     """Ensure that the lists template redirects unauthenticated users to login."""
     response = client_unauthed.get("/lists/")
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2025 Max Mehl <https://mehl.mx>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for seeding the database from a seed file."""
+
+import json
+from pathlib import Path
+
+import pytest
+from werkzeug.security import check_password_hash
+
+from castmail2list import seeder
+from castmail2list.models import AlembicVersion, MailingList, Subscriber, User, db
+from castmail2list.seeder import seed_database
+
+
+def test_seed_database_lists_and_subscribers(client_unauthed, tmp_path, monkeypatch):
+    """Lists, their subscribers and users from the seed file are inserted, also across batches."""
+    monkeypatch.setattr(seeder, "SEED_BATCH_SIZE", 2)
+    seed = {
+        "users": [{"username": "admin", "password": "admin"}],
+        "lists": [
+            {
+                "id": "general",
+                "address": "General@Example.com",
+                "mode": "broadcast",
+                "imap_host": "imap.example.com",
+                "imap_user": "general@example.com",
+                "imap_pass": "secret",
+                "subscribers": [
+                    {"name": "Alice", "email": " Alice@Example.com "},
+                    {"email": "bob@example.com", "subscriber_type": "list"},
+                    {"email": "invalid"},
+                    "not a dict",
+                ],
+            },
+            {
+                "id": "group",
+                "address": "group@example.com",
+                "mode": "group",
+                "imap_host": "imap.example.com",
+                "imap_port": "143",
+                "imap_user": "group@example.com",
+                "imap_pass": "secret",
+                "subscribers": [{"email": "carol@example.com"}],
+            },
+        ],
+    }
+    seed_file = tmp_path / "seed.json"
+    seed_file.write_text(json.dumps(seed), encoding="utf-8")
+
+    seed_database(client_unauthed.application, str(seed_file))
+
+    assert db.session.get(MailingList, "general").address == "general@example.com"
+    assert db.session.get(MailingList, "general").imap_port == 993
+    assert db.session.get(MailingList, "group").imap_port == 143
+    subs = {(sub.list_id, sub.email): sub for sub in Subscriber.query.order_by(Subscriber.id).all()}
+    assert list(subs) == [
+        ("general", "alice@example.com"),
+        ("general", "bob@example.com"),
+        ("group", "carol@example.com"),
+    ]
+    assert subs["general", "alice@example.com"].name == "Alice"
+    assert subs["general", "bob@example.com"].subscriber_type == "list"
+    assert subs["group", "carol@example.com"].subscriber_type == "normal"
+    assert subs["group", "carol@example.com"].bounces == 0
+    head = seeder._get_alembic_head()
+    assert [v.version_num for v in AlembicVersion.query.all()] == [head]
+    user = User.query.filter_by(username="admin").one()
+    assert check_password_hash(user.password, "admin")
+
+
+def test_seed_database_skips_existing_lists(client, tmp_path):
+    """Seeding is skipped if the database already has lists."""
+    seed_file = tmp_path / "seed.json"
+    seed_file.write_text(json.dumps({"users": [{"username": "admin"}]}), encoding="utf-8")
+
+    seed_database(client.application, str(seed_file))
+
+    assert User.query.filter_by(username="admin").count() == 0
+
+
+def test_seed_database_exits_on_missing_or_invalid_file(client_unauthed, tmp_path):
+    """Seeding exits if the seed file is missing or not valid JSON."""
+    with pytest.raises(SystemExit):
+        seed_database(client_unauthed.application, str(tmp_path / "missing.json"))
+
+    seed_file = tmp_path / "seed.json"
+    seed_file.write_text("{invalid", encoding="utf-8")
+    with pytest.raises(SystemExit):
+        seed_database(client_unauthed.application, str(seed_file))
+
+
+def test_seed_database_default_seed_file(client_unauthed):
+    """The example seed file shipped with the package matches the seeder's format."""
+    seed_file = Path(seeder.__file__).parent / "seed_default.json"
+    seed = json.loads(seed_file.read_text(encoding="utf-8"))
+
+    seed_database(client_unauthed.application, str(seed_file))
+
+    assert MailingList.query.count() == len(seed["lists"])
+    assert User.query.count() == len(seed["users"])
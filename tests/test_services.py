@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2025 Max Mehl <https://mehl.mx>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""Tests for the service layer shared by the API and web interface."""
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from castmail2list.models import Subscriber, db
+from castmail2list.services import (
+    add_subscriber_to_list,
+    delete_subscriber_from_list,
+    get_subscriber_by_id,
+    update_subscriber_in_list,
+)
+
+from .conftest import add_subscriber
+
+
+def test_add_subscriber_to_list(client, monkeypatch):
+    """Subscribers are added once per list, and only to existing lists."""
+    del client  # ensure app and DB fixtures are active
+    # Avoid DNS lookups and the special-use domain check for example.com
+    monkeypatch.setattr("castmail2list.services.validate_email", lambda email: "@" in email)
+
+    assert add_subscriber_to_list("test", " User@Example.com ", name="User") == ""
+    assert Subscriber.query.filter_by(list_id="test", email="user@example.com").count() == 1
+
+    assert "already subscribed" in add_subscriber_to_list("test", "user@example.com")
+    assert "not found" in add_subscriber_to_list("missing", "user@example.com")
+    assert "Invalid email" in add_subscriber_to_list("test", "invalid")
+
+
+def test_delete_subscriber_from_list(client):
+    """Subscribers are deleted only from the given, existing list."""
+    del client  # ensure app and DB fixtures are active
+    add_subscriber(email="user@example.com", list_id="test")
+
+    assert "not found" in delete_subscriber_from_list("missing", "user@example.com")
+    assert "not found on list" in delete_subscriber_from_list("test", "other@example.com")
+    assert delete_subscriber_from_list("test", "user@example.com") == ""
+    assert Subscriber.query.filter_by(list_id="test").count() == 0
+
+
+def test_get_subscriber_by_id(client):
+    """Subscribers are only returned for the list they belong to."""
+    del client  # ensure app and DB fixtures are active
+    subscriber = add_subscriber(email="user@example.com", list_id="test")
+    orphan = add_subscriber(email="orphan@example.com", list_id="missing")
+
+    assert get_subscriber_by_id("test", subscriber.id) == (subscriber, None)
+    assert get_subscriber_by_id("test", subscriber.id + 1)[1] is not None
+    assert get_subscriber_by_id("missing", subscriber.id)[1] is not None
+    assert get_subscriber_by_id("test", orphan.id) == (
+        None,
+        f"Subscriber with ID {orphan.id} not found on list test",
+    )
+
+
+def test_update_subscriber_in_list(client, monkeypatch):
+    """Subscribers are updated only on their own list and without email conflicts."""
+    del client  # ensure app and DB fixtures are active
+    monkeypatch.setattr("castmail2list.services.validate_email", lambda email: "@" in email)
+    subscriber = add_subscriber(email="user@example.com", list_id="test")
+    add_subscriber(email="other@example.com", list_id="test")
+    orphan = add_subscriber(email="orphan@example.com", list_id="missing")
+
+    assert "not found" in update_subscriber_in_list("missing", subscriber.id, name="X")
+    assert "not found on list" in update_subscriber_in_list("test", orphan.id + 1, name="X")
+    # Subscribers of other lists are treated like missing ones
+    assert "not found on list" in update_subscriber_in_list("test", orphan.id, name="X")
+    assert "already subscribed" in update_subscriber_in_list(
+        "test", subscriber.id, email="other@example.com"
+    )
+
+    assert update_subscriber_in_list("test", subscriber.id, email="New@Example.com") == ""
+    assert subscriber.email == "new@example.com"
+
+    # Same address in different casing is not validated again
+    monkeypatch.setattr("castmail2list.services.validate_email", lambda _email: False)
+    assert update_subscriber_in_list("test", subscriber.id, email=" NEW@example.com") == ""
+    assert subscriber.email == "new@example.com"
+
+
+def test_delete_subscriber_database_error(client, monkeypatch):
+    """Database errors on commit are rolled back and returned as message."""
+    del client  # ensure app and DB fixtures are active
+    add_subscriber(email="user@example.com", list_id="test")
+
+    def fail() -> None:
+        msg = "commit failed"
+        raise SQLAlchemyError(msg)
+
+    monkeypatch.setattr(db.session, "commit", fail)
+    assert "commit failed" in delete_subscriber_from_list("test", "user@example.com")
+    monkeypatch.undo()
+    assert Subscriber.query.filter_by(list_id="test").count() == 1
@@ -6,18 +6,31 @@
 
 from __future__ import annotations
 
+import os
+import sqlite3
 import subprocess
+from contextlib import closing
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, NoReturn
 
 import pytest
 from flask import Flask
-
-from castmail2list import utils
-from castmail2list.app import create_app
-from castmail2list.models import EmailIn, EmailOut, MailingList, Subscriber, db
-from castmail2list.utils import create_bounce_address, parse_bounce_address, parse_older_than
+from flask_migrate import upgrade
+from imap_tools import MailMessage
+from sqlalchemy import create_engine, event, insert, text, update
+
+from castmail2list import status, utils
+from castmail2list.app import backup_sqlite_database, create_app
+from castmail2list.models import EmailIn, EmailOut, Logs, MailingList, Subscriber, db
+from castmail2list.utils import (
+    create_bounce_address,
+    create_bounce_address_template,
+    format_bounce_address,
+    get_message_id_from_incoming,
+    parse_bounce_address,
+    parse_older_than,
+)
 
 if TYPE_CHECKING:
     from pytest import MonkeyPatch
@@ -59,6 +72,38 @@ def test_create_bounce_address_special_chars() -> None:
     assert bounce_address == "list1+bounces--jane.doe=wäb.de@list.example.com"
 
 
+def test_create_bounce_address_template() -> None:
+    """Test that a cached bounce template yields the same address as create_bounce_address."""
+    list_address = "list1@list.example.com"
+    template = create_bounce_address_template(list_address)
+
+    assert template == ("list1+bounces--", "@list.example.com")
+    for recipient in ("jane.doe@gmail.com", "jane.doe+test@gmail.com", "jane.doe@wäb.de"):
+        assert format_bounce_address(template, recipient) == create_bounce_address(
+            list_address, recipient
+        )
+
+
+def test_create_bounce_address_template_braces() -> None:
+    """Test that braces in the list address are not treated as placeholders."""
+    template = create_bounce_address_template("li{st}@list.example.com")
+
+    assert format_bounce_address(template, "jane@gmail.com") == (
+        "li{st}+bounces--jane=gmail.com@list.example.com"
+    )
+
+
+def test_get_message_id_from_incoming() -> None:
+    """Test that the Message-ID is returned without brackets, or a UUID if missing."""
+    with_mid = MailMessage.from_bytes(b"Message-ID: <abc@example.com>\r\nSubject: x\r\n\r\nbody")
+    without_mid = MailMessage.from_bytes(b"Subject: x\r\n\r\nbody")
+
+    assert get_message_id_from_incoming(with_mid) == "abc@example.com"
+    generated = get_message_id_from_incoming(without_mid)
+    assert len(generated) == 36
+    assert generated != get_message_id_from_incoming(without_mid)
+
+
 @pytest.mark.parametrize(
     ("value", "expected_seconds"),
     [
@@ -123,6 +168,12 @@ def test_parse_bounce_address_plus() -> None:
     assert original_email == "jane.doe+test@gmail.com"
 
 
+def test_parse_bounce_address_invalid() -> None:
+    """Test the parse_bounce_address function: addresses without bounce marker or domain."""
+    assert parse_bounce_address("list1@list.example.com") is None
+    assert parse_bounce_address("list1+bounces--jane.doe=gmail.com") is None
+
+
 def test_parse_bounce_address_hyphen() -> None:
     """Test the parse_bounce_address function: handling hyphen sign in email."""
     bounce_address = "list1+bounces--jane-test=gmail.com@list.example.com"
@@ -140,14 +191,30 @@ def test_normalize_and_string_list_helpers() -> None:
 
     assert utils.string_to_list("a, b\nc") == ["a", "b", "c"]
     assert utils.string_to_list("") == []
+    assert utils.string_to_list(" a,,\n\n, B\r\n", lower=True) == ["a", "b"]
+    assert utils.string_to_list("b, A\na, b", lower=True) == ["b", "a"]
+    assert utils.normalize_email_list("b@y.com, a@x.com\nb@y.com") == "b@y.com, a@x.com"
 
 
 def test_get_version_info_debug_and_non_debug(monkeypatch: MonkeyPatch) -> None:
     """get_version_info returns version and includes commit when debug."""
     assert utils.get_version_info(debug=False) == utils.__version__
 
-    monkeypatch.setattr(subprocess, "check_output", lambda *_: b"deadbeef\n")
-    assert "(" in utils.get_version_info(debug=True)
+    calls: list[list[str]] = []
+
+    def check_output(cmd: list[str]) -> bytes:
+        calls.append(cmd)
+        return b"deadbeef\n"
+
+    monkeypatch.setattr(subprocess, "check_output", check_output)
+    utils._get_git_commit.cache_clear()
+    try:
+        assert utils.get_version_info(debug=True) == f"{utils.__version__} (deadbeef)"
+        # git is only called once per process
+        assert utils.get_version_info(debug=True) == f"{utils.__version__} (deadbeef)"
+        assert len(calls) == 1
+    finally:
+        utils._get_git_commit.cache_clear()
 
 
 def test_run_only_once_behavior(monkeypatch: MonkeyPatch) -> None:
@@ -182,6 +249,8 @@ def test_is_expanded_address_the_mailing_list() -> None:
     assert not utils.is_expanded_address_the_mailing_list(
         "other+test@example.com", "list+test@example.com"
     )
+    # Addresses without domain do not match, instead of raising
+    assert not utils.is_expanded_address_the_mailing_list("list", "list@example.com")
 
 
 def test_get_app_bin_dir_and_user_config_path() -> None:
@@ -271,6 +340,7 @@ def test_is_email_a_list_and_get_list_subscribers(client):
 
     # is_email_a_list returns None for non-list address
     assert utils.is_email_a_list("whatever@example.net") is None
+    assert utils.get_list_addresses() == {"list@example.com", "t@example.com"}
 
     s = Subscriber(list_id=ml.id, email="alice@example.com")
     db.session.add(s)
@@ -279,6 +349,200 @@ def test_is_email_a_list_and_get_list_subscribers(client):
     subs = utils.get_list_recipients_recursive(ml.id)
     assert any(sub == "alice@example.com" for sub in subs)
 
+    assert utils.get_list_subscribers(ml.id) == {
+        "alice@example.com": {
+            "id": s.id,
+            "name": None,
+            "email": "alice@example.com",
+            "comment": None,
+            "subscriber_type": "normal",
+            "list_id": "T",
+        }
+    }
+
+
+def test_get_all_subscribers(client):
+    """get_all_subscribers() maps each address to its lists and sums up its bounces."""
+    del client  # ensure app and DB fixtures are active
+
+    ml = MailingList(
+        id="t1",
+        address="t1@example.com",
+        mode="broadcast",
+        imap_host="imap.example",
+        imap_port=993,
+        imap_user="u",
+        imap_pass="p",
+    )
+    db.session.add(ml)
+    db.session.add_all(
+        [
+            Subscriber(list_id="test", email="bob@example.com", bounces=1),
+            Subscriber(list_id="t1", email="bob@example.com", bounces=2),
+            Subscriber(list_id="t1", email="alice@example.com"),
+        ]
+    )
+    db.session.commit()
+
+    subscribers = utils.get_all_subscribers()
+
+    assert list(subscribers) == ["alice@example.com", "bob@example.com"]
+    assert subscribers["alice@example.com"] == {"lists": [ml], "bounces": 0}
+    assert {list_.id for list_ in subscribers["bob@example.com"]["lists"]} == {"test", "t1"}
+    assert subscribers["bob@example.com"]["bounces"] == 3
+
+
+def test_subscriber_email_validated_on_set_only(client):
+    """The email validator normalizes assigned values, but does not run for loaded rows."""
+    del client  # ensure app and DB fixtures are active
+
+    sub = Subscriber(list_id="test", email="Alice@Example.com")
+    assert sub.email == "alice@example.com"
+    with pytest.raises(ValueError, match="Invalid email address"):
+        Subscriber(list_id="test", email="invalid")
+
+    db.session.execute(insert(Subscriber), [{"list_id": "test", "email": "Bob@Example.com"}])
+    db.session.commit()
+    db.session.expire_all()
+    assert Subscriber.query.filter_by(list_id="test").one().email == "Bob@Example.com"
+
+
+def test_model_constructor_rejects_unknown_attributes() -> None:
+    """The shared model constructor only accepts the mapped attributes of each model."""
+    assert "email" in Subscriber._mapped_attribute_keys
+    assert "email" not in MailingList._mapped_attribute_keys
+
+    with pytest.raises(TypeError, match="Unexpected keyword argument 'email' for MailingList"):
+        MailingList(id="test", email="alice@example.com")
+
+
+def test_timestamp_defaults_set_at_insert(client):
+    """Timestamp columns default to the time of insertion, not of module import."""
+    del client  # ensure app and DB fixtures are active
+
+    before = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    msg_in = EmailIn(message_id="in-1", list_id="test", headers="{}")
+    msg_out = EmailOut(message_id="out-1", email_in_mid="in-1", list_id="test")
+    log = Logs(level="info", event="test", message="test")
+    db.session.add_all([msg_in, msg_out, log])
+    db.session.commit()
+
+    assert msg_in.received_at >= before
+    assert msg_out.sent_at >= before
+    assert log.timestamp >= before
+
+
+def test_get_list_by_id_uses_identity_map(client):
+    """get_list_by_id() only queries the database for lists not yet loaded in the session."""
+    del client  # ensure app and DB fixtures are active
+
+    statements: list[str] = []
+
+    def count(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    db.session.expunge_all()
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        ml = utils.get_list_by_id("test")
+        assert ml is not None
+        assert utils.get_list_by_id("test") is ml
+        assert utils.get_list_by_id("missing") is None
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    assert len(statements) == 2
+
+
+def test_is_email_a_list_cached_per_request(client):
+    """is_email_a_list() loads the list addresses only once per request."""
+    statements: list[str] = []
+
+    def count(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        with client.application.test_request_context():
+            assert utils.is_email_a_list("List+tag@Example.com").id == "test"
+            assert utils.is_email_a_list("list@example.com").id == "test"
+            assert utils.is_email_a_list("other@example.com") is None
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    assert len(statements) == 1
+
+
+def test_sqlite_connection_pragmas(client):
+    """SQLite connections use the write-ahead log and relaxed syncing."""
+    del client  # ensure app and DB fixtures are active
+
+    assert db.session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+    assert db.session.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+
+def test_sqlite_pragmas_only_for_app_engine(client, tmp_path: Path) -> None:
+    """Other SQLite engines in the same process keep their default journal mode."""
+    del client  # ensure the app and its engine listener exist
+    engine = create_engine(f"sqlite:///{tmp_path / 'other.db'}")
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    finally:
+        engine.dispose()
+
+
+def test_backup_sqlite_database_includes_wal(tmp_path: Path) -> None:
+    """The SQLite backup contains changes that are still only in the write-ahead log."""
+    db_path = tmp_path / "test.db"
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA wal_autocheckpoint=0")
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.execute("INSERT INTO t VALUES (42)")
+        conn.commit()
+
+        backup_sqlite_database(f"sqlite:///{db_path}")
+
+    backups = list(tmp_path.glob("test.db.backup-*"))
+    assert len(backups) == 1
+    with closing(sqlite3.connect(backups[0])) as conn:
+        assert conn.execute("SELECT x FROM t").fetchall() == [(42,)]
+
+
+def test_get_all_messages_id_from_raw_email() -> None:
+    """Message-IDs and Original-Message-IDs are extracted case-insensitively."""
+    raw = (
+        "Message-ID: <bounce@example.com>\n"
+        "Subject: Undelivered\n"
+        "\n"
+        "original-message-id: <orig@example.com>\n"
+        "X-Message-ID: <ignored@example.com>\n" + "x" * 1000 + "\n"
+        "MESSAGE-ID:orig2@example.com\n"
+    )
+    assert utils.get_all_messages_id_from_raw_email(raw) == [
+        "bounce@example.com",
+        "orig@example.com",
+        "orig2@example.com",
+    ]
+
+
+def test_get_message_id_in_db_load_raw(client):
+    """get_message_id_in_db() loads the deferred raw text only if requested."""
+    del client  # ensure app and DB fixtures are active
+
+    db.session.add(EmailIn(message_id="in-1", list_id="test", headers="{}", raw="raw in"))
+    db.session.add(EmailOut(message_id="in-1", email_in_mid="in-1", list_id="test", raw="raw out"))
+    db.session.commit()
+    db.session.expunge_all()
+
+    msgs = utils.get_message_id_in_db(["in-1"])
+    assert all("raw" not in msg.__dict__ for msg in msgs)
+
+    db.session.expunge_all()
+    msgs = utils.get_message_id_in_db(["in-1"], load_raw=True)
+    assert [msg.__dict__["raw"] for msg in msgs] == ["raw in", "raw out"]
+
 
 def test_get_list_recipients_recursive_no_subs(client):
     """get_list_recipients_recursive() returns empty list when no subscribers exist."""
@@ -413,6 +677,51 @@ def test_get_list_recipients_recursive_circular_reference(client):
     assert list(subs.keys()) == ["alice@example.com", "bob@example.com"]
 
 
+def test_get_list_recipients_recursive_query_count(client):
+    """get_list_recipients_recursive() does not query once per recipient to detect nested lists."""
+    del client  # ensure app and DB fixtures are active
+
+    for list_id in ("l1", "l2"):
+        db.session.add(
+            MailingList(
+                id=list_id,
+                address=f"{list_id}@example.com",
+                mode="broadcast",
+                imap_host="imap.example",
+                imap_port=993,
+                imap_user="u",
+                imap_pass="p",
+            )
+        )
+    db.session.commit()
+    db.session.execute(
+        insert(Subscriber),
+        [{"list_id": "l1", "email": f"user{i}@example.com"} for i in range(20)]
+        + [
+            {"list_id": "l1", "email": "L2+tag@Example.com", "subscriber_type": "list"},
+            {"list_id": "l2", "email": "nested@example.com"},
+        ],
+    )
+    db.session.commit()
+
+    statements: list[str] = []
+
+    def count(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        recipients = utils.get_list_recipients_recursive("l1")
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+
+    assert len(recipients) == 21
+    assert recipients["nested@example.com"]["source"] == ["l2"]
+    assert "L2+tag@Example.com" not in recipients
+    # All lists, and the subscribers of each of the two levels of nesting
+    assert len(statements) == 3
+
+
 def test_get_list_recipients_recursive_deep(client):
     """get_list_recipients_recursive() handles lists subscribing to lists multiple levels deep."""
     del client  # ensure app and DB fixtures are active
@@ -670,6 +979,18 @@ def test_get_all_incoming_messages(client) -> None:
     assert recent_all[0].message_id == "bounce-1"
     assert recent_all[1].message_id == "normal-1"
 
+    # Only the newest messages are returned with a limit
+    assert [msg.message_id for msg in utils.get_all_incoming_messages(limit=2)] == [
+        "bounce-1",
+        "normal-1",
+    ]
+
+    # Counting applies the same filters in the database
+    assert utils.count_incoming_messages() == 4
+    assert utils.count_incoming_messages(only="bounces", days=7) == 1
+    assert utils.count_incoming_messages(only="ok") == 2
+    assert utils.count_incoming_messages(only="failures") == 0
+
 
 def test_get_all_outgoing_messages(client) -> None:
     """Check that get_all_outgoing_messages retrieves outgoing messages correctly."""
@@ -711,6 +1032,93 @@ def test_get_all_outgoing_messages(client) -> None:
     assert len(recent_outgoings) == 1
     assert recent_outgoings[0].message_id == "sent-1"
 
+    assert [msg.message_id for msg in utils.get_all_outgoing_messages(limit=1)] == ["sent-1"]
+    assert utils.count_outgoing_messages() == 2
+    assert utils.count_outgoing_messages(days=7) == 1
+
+
+def test_status_counts(client) -> None:
+    """The status counts lists and unique subscribers in the database."""
+    del client  # ensure app and DB fixtures are active
+    db.session.add(
+        MailingList(
+            id="old",
+            address="old@example.com",
+            deleted=True,
+            mode="broadcast",
+            imap_host="imap.example",
+            imap_port=993,
+            imap_user="u",
+            imap_pass="p",
+        )
+    )
+    db.session.add_all(
+        [
+            Subscriber(list_id="test", email="a@example.com"),
+            Subscriber(list_id="old", email="a@example.com"),
+            Subscriber(list_id="old", email="b@example.com"),
+            Subscriber(list_id="missing", email="c@example.com"),
+        ]
+    )
+    db.session.commit()
+
+    assert status.lists_count() == {"total": 2, "active": 1, "deactivated": 1}
+    assert status.subscribers_count() == len(utils.get_all_subscribers()) == 2
+
+
+def test_status_complete_periods(client) -> None:
+    """The status reports entries of the last 24 hours and 7 days from one query each."""
+    del client  # ensure app and DB fixtures are active
+    now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    db.session.add_all(
+        [
+            EmailIn(
+                message_id=f"in-{hours}",
+                list_id="test",
+                headers="{}",
+                status="ok",
+                received_at=now - timedelta(hours=hours),
+            )
+            for hours in (1, 48, 24 * 10)
+        ]
+    )
+    db.session.add(Logs(level="error", event="test", message="Error", timestamp=now))
+    db.session.commit()
+
+    stats = status.status_complete()
+    assert stats["email_in"]["count"] == 3
+    assert [msg["mid"] for msg in stats["email_in"]["hours_24"]] == ["in-1"]
+    assert [msg["mid"] for msg in stats["email_in"]["days_7"]] == ["in-1", "in-48"]
+    assert len(stats["email_in"]["last_5"]) == 3
+    assert len(stats["errors"]["hours_24"]) == len(stats["errors"]["days_7"]) == 1
+    assert stats["errors"]["last_5"][0]["message"] == "Error"
+
+
+def test_get_log_entries_limit_and_fields(client) -> None:
+    """get_log_entries() returns the newest entries first and can skip columns."""
+    del client  # ensure app and DB fixtures are active
+    now = datetime.now(tz=timezone.utc).replace(tzinfo=None)
+    db.session.add_all(
+        [
+            Logs(
+                level="error",
+                event="test",
+                message=f"Error {i}",
+                details={"i": i},
+                timestamp=now - timedelta(days=i),
+            )
+            for i in range(4)
+        ]
+    )
+    db.session.add(Logs(level="warning", event="test", message="Warning", timestamp=now))
+    db.session.commit()
+    db.session.expunge_all()
+
+    last_2 = utils.get_log_entries(exact=True, limit=2, fields=("id", "message"), level="error")
+    assert [log.message for log in last_2] == ["Error 0", "Error 1"]
+    assert "details" not in last_2[0].__dict__
+    assert len(utils.get_log_entries(exact=True, days=2, level="error")) == 2
+
 
 def test_redact_helper() -> None:
     """redact() exposes ~50% of the value and masks the rest."""
@@ -731,6 +1139,62 @@ def test_create_app_raises_on_missing_secret_key() -> None:
         )
 
 
+# ---------------------- Migration Tests ----------------------
+
+
+def _insert_list(list_id: str, address: str) -> None:
+    """Insert a mailing list row directly, as the model would lowercase the address."""
+    db.session.execute(
+        insert(MailingList.__table__).values(
+            id=list_id,
+            address=address,
+            mode="broadcast",
+            imap_host="imap.example",
+            imap_port=993,
+            imap_user="u",
+            imap_pass="p",
+        )
+    )
+    db.session.commit()
+
+
+def test_migration_lowercases_list_addresses(
+    tmp_path: Path, capfd: pytest.CaptureFixture[str]
+) -> None:
+    """The list address migration lowercases mixed-case addresses, but aborts on clashes."""
+    app = create_app(
+        config_overrides={
+            "SECRET_KEY": "test",
+            "DATABASE_URI": f"sqlite:///{tmp_path / 'db.sqlite3'}",
+        },
+        one_off_call=True,
+    )
+    with app.app_context():
+        upgrade(revision="1d7b3e9a4f60")
+        _insert_list("mixed", "Mixed@Example.com")
+        _insert_list("clash1", "Clash@Example.com")
+        _insert_list("clash2", "clash@example.com")
+
+        # Flask-Migrate logs the error of the migration to stderr and exits
+        with pytest.raises(SystemExit):
+            upgrade()
+        assert "clash1 (Clash@Example.com), clash2 (clash@example.com)" in capfd.readouterr().err
+
+        db.session.execute(
+            update(MailingList.__table__)
+            .where(MailingList.__table__.c.id == "clash2")
+            .values(address="other@example.com")
+        )
+        db.session.commit()
+        upgrade()
+        addresses = dict(db.session.execute(text("SELECT id, address FROM list")).all())
+        assert addresses == {
+            "mixed": "mixed@example.com",
+            "clash1": "clash@example.com",
+            "clash2": "other@example.com",
+        }
+
+
 # ---------------------- SCSS Compilation Tests ----------------------
 
 
@@ -861,3 +1325,33 @@ def test_compile_scss_on_startup_resolves_paths_and_compiles(monkeypatch: Monkey
 
     assert calls == [(expected_input, expected_output)]
     assert result == [(expected_input, expected_output)]
+
+
+def test_compile_scss_on_startup_skips_up_to_date_css(
+    monkeypatch: MonkeyPatch, tmp_path: Path
+) -> None:
+    """compile_scss_on_startup should only compile if an SCSS file is newer than the CSS."""
+    calls: list[tuple[str, str]] = []
+    monkeypatch.setattr(utils, "_compile_scss", lambda **kwargs: calls.append(kwargs))
+    (tmp_path / "scss" / "partials").mkdir(parents=True)
+    scss_input = tmp_path / "scss" / "main.scss"
+    scss_partial = tmp_path / "scss" / "partials" / "_colors.scss"
+    css_output = tmp_path / "main.css"
+    scss_input.write_text("@use 'partials/colors';")
+    scss_partial.write_text("$a: 1;")
+
+    # Absolute paths are kept as they are
+    files = [(str(scss_input), str(css_output))]
+    utils.compile_scss_on_startup(files)
+    assert len(calls) == 1
+
+    css_output.write_text("")
+    os.utime(scss_input, (1000, 1000))
+    os.utime(scss_partial, (1000, 1000))
+    utils.compile_scss_on_startup(files)
+    assert len(calls) == 1
+
+    # A changed imported file triggers compiling again
+    os.utime(scss_partial, (css_output.stat().st_mtime + 10,) * 2)
+    utils.compile_scss_on_startup(files)
+    assert len(calls) == 2